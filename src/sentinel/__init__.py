@@ -12,24 +12,86 @@ import os
 import sys
 import time
 import json
+import queue
+import atexit
+import threading
 import logging
+import logging.handlers
 import importlib
+import collections
+from types import MappingProxyType
 from typing import Dict, List, Any, Callable, Optional, Union
 from functools import wraps
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+# Records at or above this level are pushed to disk as soon as they are written
+_LOG_FLUSH_LEVEL = logging.ERROR
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through an 8 KiB buffer, flushing it on errors"""
+    
+    def _open(self):
+        # Opened lazily on first emit; create the logs directory at that point
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return open(self.baseFilename, self.mode, buffering=8192,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            # MemoryHandler hands records over but never flushes its target;
+            # without this an error could sit in the buffer until a crash
+            if record.levelno >= _LOG_FLUSH_LEVEL:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
 # Configure logging
+# Records are enqueued on the calling thread and written by a single listener
+# thread, so routing never blocks on stream or file I/O. File records are
+# further batched in memory and written in bulk; an error record releases the
+# batch and flushes the file buffer right away.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_file_handler = _BufferedFileHandler(os.path.join('logs', 'sentinel.log'), delay=True)
+_file_handler.setFormatter(_log_formatter)
+_log_handlers = [
+    _stream_handler,
+    logging.handlers.MemoryHandler(
+        capacity=256,
+        flushLevel=_LOG_FLUSH_LEVEL,
+        target=_file_handler,
+        flushOnClose=True
+    )
+]
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Installed on the root logger as before, so other vael.* loggers still reach
+# these handlers and apps that configure logging first keep their own setup.
+# The queue side only merges args into the message; the listener's handlers
+# apply the real format.
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.join('logs', 'sentinel.log'))
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger('vael.sentinel')
 
 # Symbolic constants for token efficiency
-SYMBOLS = {
+SYMBOLS = MappingProxyType({
     "ACTIVE": "🟢",
     "INACTIVE": "⚪",
     "WARNING": "🟠",
@@ -46,45 +108,151 @@ SYMBOLS = {
     "ENTITY": "🧩",
     "ROUTE": "🔄",
     "SOCKET": "🔌"
-}
+})
 
 # Entity status codes
-STATUS = {
+STATUS = MappingProxyType({
     "ACTIVE": 1,
     "INACTIVE": 0,
     "WARNING": 2,
     "ERROR": 3,
     "INITIALIZING": 4,
     "TERMINATING": 5
+})
+
+# Status code -> symbol lookup table
+STATUS_SYMBOL = MappingProxyType({
+    STATUS["ACTIVE"]: SYMBOLS["ACTIVE"],
+    STATUS["INACTIVE"]: SYMBOLS["INACTIVE"],
+    STATUS["WARNING"]: SYMBOLS["WARNING"],
+    STATUS["ERROR"]: SYMBOLS["ERROR"],
+    STATUS["INITIALIZING"]: SYMBOLS["PENDING"],
+    STATUS["TERMINATING"]: SYMBOLS["PROCESSING"]
+})
+
+# Log level names accepted by log_event
+_LOG_LEVELS = MappingProxyType({
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL
+})
+
+# Frequently used symbols, resolved once
+_SYM_INFO = SYMBOLS["INFO"]
+_SYM_SUCCESS = SYMBOLS["SUCCESS"]
+_SYM_WARNING = SYMBOLS["WARNING"]
+_SYM_ERROR = SYMBOLS["ERROR"]
+
+# Keepalive fast path
+_PING_SET = frozenset({"ping", "PING", "Ping"})
+_PONG_PAYLOAD = "pong"
+
+# Snapshot events: when several are queued only the newest is worth sending
+_COALESCED_EVENTS = frozenset({'status', 'heartbeat'})
+
+# Most import failures remembered; entity names come from callers, so the
+# oldest are evicted first
+_MAX_IMPORT_MISSES = 256
+
+# Shared, immutable fields of every success / error response
+_OK_SHELL = MappingProxyType({'status': 'success', 'symbol': _SYM_SUCCESS})
+_ERR_SHELL = MappingProxyType({'status': 'error', 'symbol': _SYM_ERROR})
+
+# OpenRouter fallback endpoint
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# OpenRouter credentials, read once at import
+_API_KEY = os.environ.get('OPENROUTER_API_KEY', '')
+_HEADERS = {
+    "Authorization": f"Bearer {_API_KEY}",
+    "Content-Type": "application/json"
 }
 
+# Shared HTTP session for the fallback, created on first use so connections
+# (and their TLS handshakes) are reused across requests
+_http_session = None
+
+def _get_http_session():
+    """
+    Get the shared HTTP session used for fallback requests
+    
+    Returns:
+        requests.Session with a pooled, retrying HTTPS adapter
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        _http_session = session
+    return _http_session
+
 class Sentinel:
     """
     Sentinel class for VAEL Core integration with WebSocket interface.
     
     Handles message routing, entity registration, and system monitoring.
+    
+    Attributes live in __slots__; subclasses must declare __slots__ for any
+    attributes they add.
     """
     
+    __slots__ = (
+        'initialized', 'entities', 'routes', 'handlers', 'socket', 'status',
+        'last_heartbeat', 'heartbeat_interval', 'max_history',
+        '_entity_methods', '_entity_commands', '_pulse_fns',
+        '_stale_methods', '_dispatch_lock',
+        '_hist_ts', '_hist_type', '_hist_data', '_hist_lock',
+        '_status_cache', '_status_cache_ts', '_status_dirty',
+        '_import_misses', '_import_lock',
+        '_outbox', '_sender_started',
+        '_pulse_cache', '_pulse_stop',
+        '_msg_count', '_log_sample'
+    )
+    
     def __init__(self):
         """Initialize the Sentinel entity"""
         self.initialized = False
         self.entities = {}  # Registered entities
+        self._entity_methods = {}   # Per-entity action -> bound method
+        self._entity_commands = {}  # Per-entity command -> bound method
+        self._pulse_fns = {}        # Per-entity pulse() for entities that have one
+        self._stale_methods = set()  # Entities whose dispatch tables need a rebuild
+        self._dispatch_lock = threading.Lock()
         self.routes = {}    # Message routes
         self.handlers = {}  # Event handlers
         self.socket = None  # WebSocket reference
         self.status = STATUS["INITIALIZING"]
         self.last_heartbeat = time.time()
         self.heartbeat_interval = 30  # seconds
-        self.event_history = []       # Recent events (limited size)
         self.max_history = 50         # Maximum events to keep
+        # Recent events, stored column-wise (timestamp, type, data)
+        self._hist_ts = collections.deque(maxlen=self.max_history)
+        self._hist_type = collections.deque(maxlen=self.max_history)
+        self._hist_data = collections.deque(maxlen=self.max_history)
+        self._hist_lock = threading.Lock()  # Keeps the three columns in step
+        self._status_cache = None     # Last emitted status payload
+        self._status_cache_ts = 0.0   # When the cached payload was built
+        self._status_dirty = True     # Entity set/health changed since last build
+        self._import_misses = collections.OrderedDict()  # Entity names that failed to import
+        self._import_lock = threading.Lock()
+        self._outbox = queue.Queue(maxsize=256)  # Pending (event, payload) emits
+        self._sender_started = False
+        self._pulse_cache = None      # (healthy, unhealthy) names from the last pulse
+        self._msg_count = 0           # Messages routed so far
+        self._log_sample = 100        # Log one in this many messages (tunable at runtime)
+        self._pulse_stop = threading.Event()  # Set to end the pulse refresh loop
         
-        # Create logs directory if it doesn't exist
-        os.makedirs('logs', exist_ok=True)
-        
-        logger.info(f"{SYMBOLS['ENTITY']} Sentinel initializing")
+        logger.info("%s Sentinel initializing", SYMBOLS['ENTITY'])
         self.initialized = True
         self.status = STATUS["ACTIVE"]
-        logger.info(f"{SYMBOLS['SUCCESS']} Sentinel initialized")
+        threading.Thread(target=self._pulse_loop, name='sentinel-pulse', daemon=True).start()
+        logger.info("%s Sentinel initialized", _SYM_SUCCESS)
     
     def register_socket(self, socket):
         """
@@ -94,28 +262,115 @@ class Sentinel:
             socket: WebSocket interface object
         """
         self.socket = socket
-        logger.info(f"{SYMBOLS['SOCKET']} WebSocket interface registered")
+        logger.info("%s WebSocket interface registered", SYMBOLS['SOCKET'])
         
-        # Register default event handlers
+        # Start the outbound sender and register default event handlers
+        self._start_sender()
         self._register_default_handlers()
     
+    def _start_sender(self):
+        """Start the background task that drains queued emits to the socket"""
+        if self._sender_started:
+            return
+        self._sender_started = True
+        
+        # Prefer the socket's own task runner so async modes (eventlet/gevent) work
+        if hasattr(self.socket, 'start_background_task'):
+            self.socket.start_background_task(self._sender_loop)
+        else:
+            threading.Thread(target=self._sender_loop, name='sentinel-sender', daemon=True).start()
+    
+    def _sender_loop(self):
+        """Drain queued emits, sending up to 32 per wakeup"""
+        outbox = self._outbox
+        # Yield to the async hub between batches when the socket provides one
+        sleep = getattr(self.socket, 'sleep', None)
+        while True:
+            batch = [outbox.get()]
+            try:
+                while len(batch) < 32:
+                    batch.append(outbox.get_nowait())
+            except queue.Empty:
+                pass
+            
+            if len(batch) > 1:
+                batch = self._coalesce(batch)
+            
+            for event, payload in batch:
+                try:
+                    self.socket.emit(event, payload)
+                except Exception as e:
+                    logger.error("%s Failed to emit '%s': %s", _SYM_ERROR, event, e)
+            
+            if sleep is not None:
+                sleep(0)
+    
+    @staticmethod
+    def _coalesce(batch: List) -> List:
+        """
+        Drop superseded snapshot events from a batch
+        
+        Args:
+            batch: Queued (event, payload) pairs, oldest first
+            
+        Returns:
+            The batch with only the newest of each _COALESCED_EVENTS event
+        """
+        seen = set()
+        kept = []
+        for item in reversed(batch):
+            event = item[0]
+            if event in _COALESCED_EVENTS:
+                if event in seen:
+                    continue
+                seen.add(event)
+            kept.append(item)
+        kept.reverse()
+        return kept
+    
+    def _emit(self, event: str, payload: Any):
+        """
+        Queue an event for the socket without blocking the caller
+        
+        When the queue is full the oldest pending event is dropped.
+        
+        Args:
+            event: Event name
+            payload: Event payload
+        """
+        if not self.socket:
+            return
+        
+        try:
+            self._outbox.put_nowait((event, payload))
+        except queue.Full:
+            try:
+                dropped, _ = self._outbox.get_nowait()
+                logger.warning("%s Outbound queue full, dropped '%s' event", _SYM_WARNING, dropped)
+            except queue.Empty:
+                pass
+            try:
+                self._outbox.put_nowait((event, payload))
+            except queue.Full:
+                logger.warning("%s Outbound queue full, dropped '%s' event", _SYM_WARNING, event)
+    
     def _register_default_handlers(self):
         """Register default event handlers for WebSocket"""
         if not self.socket:
-            logger.warning(f"{SYMBOLS['WARNING']} Cannot register handlers: No WebSocket registered")
+            logger.warning("%s Cannot register handlers: No WebSocket registered", _SYM_WARNING)
             return
         
         try:
             # Register connect handler
             @self.socket.on('connect')
             def handle_connect():
-                logger.info(f"{SYMBOLS['SOCKET']} Client connected")
+                logger.info("%s Client connected", SYMBOLS['SOCKET'])
                 self._emit_status()
             
             # Register disconnect handler
             @self.socket.on('disconnect')
             def handle_disconnect():
-                logger.info(f"{SYMBOLS['SOCKET']} Client disconnected")
+                logger.info("%s Client disconnected", SYMBOLS['SOCKET'])
             
             # Register message handler
             @self.socket.on('message')
@@ -127,16 +382,23 @@ class Sentinel:
             def handle_command(data):
                 self._route_command(data)
             
-            logger.info(f"{SYMBOLS['SUCCESS']} Default event handlers registered")
+            logger.info("%s Default event handlers registered", _SYM_SUCCESS)
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Failed to register default handlers: {str(e)}")
+            logger.error("%s Failed to register default handlers: %s", _SYM_ERROR, e)
     
     def _emit_status(self):
         """Emit current system status to client"""
         if not self.socket:
             return
         
+        # Reuse the last payload if nothing changed and it is still fresh
+        now = time.time()
+        if (not self._status_dirty and self._status_cache is not None
+                and now - self._status_cache_ts < 1.0):
+            self._emit('status', self._status_cache)
+            return
+        
         # Collect entity statuses
         entity_statuses = {}
         for name, entity in self.entities.items():
@@ -151,15 +413,18 @@ class Sentinel:
                     'symbol': SYMBOLS["ACTIVE"]
                 }
         
-        # Emit status event
-        self.socket.emit('status', {
+        # Cache and emit status event
+        self._status_cache = {
             'sentinel': {
                 'status': self.status,
                 'symbol': self._get_status_symbol(self.status),
-                'timestamp': time.time()
+                'timestamp': now
             },
             'entities': entity_statuses
-        })
+        }
+        self._status_cache_ts = now
+        self._status_dirty = False
+        self._emit('status', self._status_cache)
     
     def _get_status_symbol(self, status_code):
         """
@@ -171,20 +436,7 @@ class Sentinel:
         Returns:
             Symbol for status code
         """
-        if status_code == STATUS["ACTIVE"]:
-            return SYMBOLS["ACTIVE"]
-        elif status_code == STATUS["INACTIVE"]:
-            return SYMBOLS["INACTIVE"]
-        elif status_code == STATUS["WARNING"]:
-            return SYMBOLS["WARNING"]
-        elif status_code == STATUS["ERROR"]:
-            return SYMBOLS["ERROR"]
-        elif status_code == STATUS["INITIALIZING"]:
-            return SYMBOLS["PENDING"]
-        elif status_code == STATUS["TERMINATING"]:
-            return SYMBOLS["PROCESSING"]
-        else:
-            return SYMBOLS["INFO"]
+        return STATUS_SYMBOL.get(status_code, _SYM_INFO)
     
     def register_entity(self, name: str, entity: Any) -> bool:
         """
@@ -198,13 +450,101 @@ class Sentinel:
             True if registration successful, False otherwise
         """
         if name in self.entities:
-            logger.warning(f"{SYMBOLS['WARNING']} Entity '{name}' already registered")
+            logger.warning("%s Entity '%s' already registered", _SYM_WARNING, name)
             return False
         
         self.entities[name] = entity
-        logger.info(f"{SYMBOLS['ENTITY']} Entity '{name}' registered")
+        self._build_method_cache(name, entity)
+        pulse_fn = getattr(entity, 'pulse', None)
+        if callable(pulse_fn):
+            self._pulse_fns[name] = pulse_fn
+        self._status_dirty = True
+        self._pulse_cache = None
+        logger.info("%s Entity '%s' registered", SYMBOLS['ENTITY'], name)
+        return True
+    
+    def _build_method_cache(self, name: str, entity: Any):
+        """
+        Build action and command dispatch tables for an entity
+        
+        Public methods take precedence over their `_`-prefixed aliases,
+        mirroring the lookup order used when routing.
+        
+        Args:
+            name: Entity name
+            entity: Entity object
+        """
+        methods = {}
+        commands = {}
+        
+        for attr in dir(entity):
+            if attr.startswith('__'):
+                continue
+            try:
+                method = getattr(entity, attr)
+            except Exception:
+                continue
+            if not callable(method):
+                continue
+            
+            private = attr.startswith('_')
+            key = attr[1:] if private else attr
+            
+            if key.startswith('command_'):
+                table, key = commands, key[len('command_'):]
+            else:
+                table = methods
+            
+            if private:
+                table.setdefault(key, method)
+            else:
+                table[key] = method
+        
+        self._entity_methods[name] = methods
+        self._entity_commands[name] = commands
+    
+    def refresh_entity(self, name: str) -> bool:
+        """
+        Flag an entity's dispatch tables for a rebuild
+        
+        Entities that gain methods after registration call this; the tables
+        are rebuilt on the next lookup that misses.
+        
+        Args:
+            name: Entity name
+            
+        Returns:
+            True if the entity is registered, False otherwise
+        """
+        if name not in self.entities:
+            return False
+        self._stale_methods.add(name)
         return True
     
+    def _resolve_method(self, cache: Dict, entity_name: str, key: str) -> Optional[Callable]:
+        """
+        Look up a cached entity method
+        
+        A miss only rebuilds the tables when the entity was flagged with
+        refresh_entity(), so unknown action names from callers stay cheap.
+        
+        Args:
+            cache: Dispatch table (actions or commands)
+            entity_name: Entity name
+            key: Action or command name
+            
+        Returns:
+            Bound method or None if not found
+        """
+        method = cache.get(entity_name, {}).get(key)
+        if method is None and entity_name in self._stale_methods:
+            with self._dispatch_lock:
+                if entity_name in self._stale_methods:
+                    self._build_method_cache(entity_name, self.entities[entity_name])
+                    self._stale_methods.discard(entity_name)
+            method = cache[entity_name].get(key)
+        return method
+    
     def register_route(self, route: str, handler: Callable) -> bool:
         """
         Register a message route
@@ -217,11 +557,11 @@ class Sentinel:
             True if registration successful, False otherwise
         """
         if route in self.routes:
-            logger.warning(f"{SYMBOLS['WARNING']} Route '{route}' already registered")
+            logger.warning("%s Route '%s' already registered", _SYM_WARNING, route)
             return False
         
         self.routes[route] = handler
-        logger.info(f"{SYMBOLS['ROUTE']} Route '{route}' registered")
+        logger.info("%s Route '%s' registered", SYMBOLS['ROUTE'], route)
         return True
     
     def _route_message(self, data: Any):
@@ -231,50 +571,46 @@ class Sentinel:
         Args:
             data: Message data
         """
+        socket = self.socket  # Bound once for the whole dispatch
+        
         try:
-            # Handle ping message
-            if isinstance(data, str) and data.lower() == "ping":
-                if self.socket:
-                    self.socket.emit('message', "pong")
+            # Handle ping message (common spellings hit the set, others pay for lower())
+            if type(data) is str and (data in _PING_SET or (len(data) == 4 and data.lower() == "ping")):
+                if socket:
+                    self._emit('message', _PONG_PAYLOAD)
                 return
             
-            # Log message
-            logger.info(f"{SYMBOLS['INFO']} Processing message: {str(data)[:50]}...")
+            # Log a sample of messages (1 in _log_sample) with a running count
+            self._msg_count += 1
+            if self._msg_count % self._log_sample == 0 and logger.isEnabledFor(logging.INFO):
+                logger.info('%s Processed %d messages; last: %.50s...', _SYM_INFO, self._msg_count, data)
             
             # Add to history
             self._add_to_history('message', data)
             
-            # Handle entity-specific message
-            if isinstance(data, dict) and 'entity' in data and 'action' in data:
+            # Handle entity-specific message; anything else (strings, partial
+            # dicts) goes to VAEL by default
+            try:
                 entity_name = data['entity']
                 action = data['action']
+            except (TypeError, KeyError):
+                response = self._route_to_vael(data)
+            else:
                 payload = data.get('payload', {})
-                
-                # Route to entity
                 response = self._route_to_entity(entity_name, action, payload)
-                
-                # Emit response
-                if self.socket:
-                    self.socket.emit('message', response)
-                
-                return
-            
-            # Handle string message (pass to VAEL by default)
-            response = self._route_to_vael(data)
             
             # Emit response
-            if self.socket:
-                self.socket.emit('message', response)
+            if socket:
+                self._emit('message', response)
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Error processing message: {str(e)}")
+            logger.error("%s Error processing message: %s", _SYM_ERROR, e)
             
             # Emit error response
-            if self.socket:
-                self.socket.emit('message', {
+            if socket:
+                self._emit('message', {
                     'error': str(e),
-                    'status': 'error',
-                    'symbol': SYMBOLS["ERROR"]
+                    **_ERR_SHELL
                 })
     
     def _route_command(self, data: Any):
@@ -284,18 +620,20 @@ class Sentinel:
         Args:
             data: Command data
         """
+        socket = self.socket  # Bound once for the whole dispatch
+        
         try:
-            if not isinstance(data, dict):
-                raise ValueError("Command must be a dictionary")
-            
-            if 'command' not in data:
-                raise ValueError("Command must have 'command' field")
+            try:
+                command = data['command']
+            except TypeError:
+                raise ValueError("Command must be a dictionary") from None
+            except KeyError:
+                raise ValueError("Command must have 'command' field") from None
             
-            command = data['command']
             args = data.get('args', {})
             
             # Log command
-            logger.info(f"{SYMBOLS['INFO']} Processing command: {command}")
+            logger.info("%s Processing command: %s", _SYM_INFO, command)
             
             # Add to history
             self._add_to_history('command', data)
@@ -310,44 +648,44 @@ class Sentinel:
                 return
             
             elif command == 'list_entities':
-                if self.socket:
-                    self.socket.emit('command_result', {
+                if socket:
+                    self._emit('command_result', {
                         'command': command,
                         'result': list(self.entities.keys()),
-                        'status': 'success',
-                        'symbol': SYMBOLS["SUCCESS"]
+                        **_OK_SHELL
                     })
                 return
             
             # Route to entity
-            if 'entity' in args:
+            try:
                 entity_name = args['entity']
+            except (TypeError, KeyError):
+                pass
+            else:
                 response = self._route_command_to_entity(entity_name, command, args)
                 
                 # Emit response
-                if self.socket:
-                    self.socket.emit('command_result', response)
+                if socket:
+                    self._emit('command_result', response)
                 
                 return
             
             # Unknown command
-            if self.socket:
-                self.socket.emit('command_result', {
+            if socket:
+                self._emit('command_result', {
                     'command': command,
                     'error': 'Unknown command',
-                    'status': 'error',
-                    'symbol': SYMBOLS["ERROR"]
+                    **_ERR_SHELL
                 })
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Error processing command: {str(e)}")
+            logger.error("%s Error processing command: %s", _SYM_ERROR, e)
             
             # Emit error response
-            if self.socket:
-                self.socket.emit('command_result', {
+            if socket:
+                self._emit('command_result', {
                     'error': str(e),
-                    'status': 'error',
-                    'symbol': SYMBOLS["ERROR"]
+                    **_ERR_SHELL
                 })
     
     def _route_to_entity(self, entity_name: str, action: str, payload: Dict) -> Dict:
@@ -366,56 +704,46 @@ class Sentinel:
         if entity_name not in self.entities:
             # Try to import entity dynamically
             if self._import_entity(entity_name):
-                logger.info(f"{SYMBOLS['SUCCESS']} Entity '{entity_name}' imported dynamically")
+                logger.info("%s Entity '%s' imported dynamically", _SYM_SUCCESS, entity_name)
             else:
-                logger.warning(f"{SYMBOLS['WARNING']} Entity '{entity_name}' not found")
+                logger.warning("%s Entity '%s' not found", _SYM_WARNING, entity_name)
                 return {
                     'entity': entity_name,
                     'action': action,
                     'error': f"Entity '{entity_name}' not found",
-                    'status': 'error',
-                    'symbol': SYMBOLS["ERROR"]
+                    **_ERR_SHELL
                 }
         
-        entity = self.entities[entity_name]
-        
         # Check if entity has method
-        if not hasattr(entity, action) and not hasattr(entity, f"_{action}"):
-            logger.warning(f"{SYMBOLS['WARNING']} Action '{action}' not found in entity '{entity_name}'")
+        method = self._resolve_method(self._entity_methods, entity_name, action)
+        if method is None:
+            logger.warning("%s Action '%s' not found in entity '%s'", _SYM_WARNING, action, entity_name)
             return {
                 'entity': entity_name,
                 'action': action,
                 'error': f"Action '{action}' not found in entity '{entity_name}'",
-                'status': 'error',
-                'symbol': SYMBOLS["ERROR"]
+                **_ERR_SHELL
             }
         
         try:
             # Call entity method
-            if hasattr(entity, action):
-                method = getattr(entity, action)
-                result = method(payload)
-            else:
-                method = getattr(entity, f"_{action}")
-                result = method(payload)
+            result = method(payload)
             
             # Return result
             return {
                 'entity': entity_name,
                 'action': action,
                 'result': result,
-                'status': 'success',
-                'symbol': SYMBOLS["SUCCESS"]
+                **_OK_SHELL
             }
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Error calling '{entity_name}.{action}': {str(e)}")
+            logger.error("%s Error calling '%s.%s': %s", _SYM_ERROR, entity_name, action, e)
             return {
                 'entity': entity_name,
                 'action': action,
                 'error': str(e),
-                'status': 'error',
-                'symbol': SYMBOLS["ERROR"]
+                **_ERR_SHELL
             }
     
     def _route_command_to_entity(self, entity_name: str, command: str, args: Dict) -> Dict:
@@ -434,57 +762,46 @@ class Sentinel:
         if entity_name not in self.entities:
             # Try to import entity dynamically
             if self._import_entity(entity_name):
-                logger.info(f"{SYMBOLS['SUCCESS']} Entity '{entity_name}' imported dynamically")
+                logger.info("%s Entity '%s' imported dynamically", _SYM_SUCCESS, entity_name)
             else:
-                logger.warning(f"{SYMBOLS['WARNING']} Entity '{entity_name}' not found")
+                logger.warning("%s Entity '%s' not found", _SYM_WARNING, entity_name)
                 return {
                     'command': command,
                     'entity': entity_name,
                     'error': f"Entity '{entity_name}' not found",
-                    'status': 'error',
-                    'symbol': SYMBOLS["ERROR"]
+                    **_ERR_SHELL
                 }
         
-        entity = self.entities[entity_name]
-        
         # Check if entity has command method
-        command_method = f"command_{command}"
-        if not hasattr(entity, command_method) and not hasattr(entity, f"_{command_method}"):
-            logger.warning(f"{SYMBOLS['WARNING']} Command '{command}' not found in entity '{entity_name}'")
+        method = self._resolve_method(self._entity_commands, entity_name, command)
+        if method is None:
+            logger.warning("%s Command '%s' not found in entity '%s'", _SYM_WARNING, command, entity_name)
             return {
                 'command': command,
                 'entity': entity_name,
                 'error': f"Command '{command}' not found in entity '{entity_name}'",
-                'status': 'error',
-                'symbol': SYMBOLS["ERROR"]
+                **_ERR_SHELL
             }
         
         try:
             # Call entity command method
-            if hasattr(entity, command_method):
-                method = getattr(entity, command_method)
-                result = method(args)
-            else:
-                method = getattr(entity, f"_{command_method}")
-                result = method(args)
+            result = method(args)
             
             # Return result
             return {
                 'command': command,
                 'entity': entity_name,
                 'result': result,
-                'status': 'success',
-                'symbol': SYMBOLS["SUCCESS"]
+                **_OK_SHELL
             }
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Error calling '{entity_name}.{command_method}': {str(e)}")
+            logger.error("%s Error calling '%s.command_%s': %s", _SYM_ERROR, entity_name, command, e)
             return {
                 'command': command,
                 'entity': entity_name,
                 'error': str(e),
-                'status': 'error',
-                'symbol': SYMBOLS["ERROR"]
+                **_ERR_SHELL
             }
     
     def _route_to_vael(self, data: Any) -> Any:
@@ -502,23 +819,25 @@ class Sentinel:
             if 'vael' not in self.entities:
                 # Try to import VAEL dynamically
                 if not self._import_entity('vael'):
-                    logger.warning(f"{SYMBOLS['WARNING']} VAEL entity not found")
+                    logger.warning("%s VAEL entity not found", _SYM_WARNING)
                     
                     # Use OpenRouter API as fallback
                     return self._fallback_process_message(data)
             
-            # Call VAEL process method
-            vael = self.entities['vael']
-            if hasattr(vael, 'process'):
-                return vael.process(data)
-            elif hasattr(vael, '_process'):
-                return vael._process(data)
-            else:
-                logger.warning(f"{SYMBOLS['WARNING']} VAEL entity has no process method")
+            # Call VAEL process method (`process`, else `_process`) from the
+            # dispatch table built at registration instead of probing per message
+            methods = self._entity_methods.get('vael')
+            if methods is None:
+                self._build_method_cache('vael', self.entities['vael'])
+                methods = self._entity_methods['vael']
+            process = methods.get('process')
+            if process is None:
+                logger.warning("%s VAEL entity has no process method", _SYM_WARNING)
                 return self._fallback_process_message(data)
+            return process(data)
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Error routing to VAEL: {str(e)}")
+            logger.error("%s Error routing to VAEL: %s", _SYM_ERROR, e)
             return self._fallback_process_message(data)
     
     def _fallback_process_message(self, data: Any) -> str:
@@ -531,32 +850,24 @@ class Sentinel:
         Returns:
             Response message
         """
+        if not _API_KEY:
+            return "Error: API key not configured. Please set the OPENROUTER_API_KEY environment variable."
+        if requests is None:
+            return "Error: the 'requests' package is required for fallback processing."
+        
         try:
-            # Import required modules
-            import requests
-            import os
-            
-            # Get API key from environment
-            api_key = os.environ.get('OPENROUTER_API_KEY', '')
-            if not api_key:
-                return "Error: API key not configured. Please set the OPENROUTER_API_KEY environment variable."
-            
             # Prepare request
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            }
-            
             body = {
                 "model": "openai/gpt-3.5-turbo",
                 "messages": [{"role": "user", "content": str(data)}]
             }
             
-            # Make request
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers=headers,
-                json=body
+            # Make request over the shared keep-alive session
+            response = _get_http_session().post(
+                OPENROUTER_URL,
+                headers=_HEADERS,
+                json=body,
+                timeout=(3.05, 30)
             )
             
             # Parse response
@@ -568,7 +879,7 @@ class Sentinel:
                 return "I'm sorry, there was an error processing your request."
         
         except Exception as e:
-            logger.error(f"{SYMBOLS['ERROR']} Fallback processing error: {str(e)}")
+            logger.error("%s Fallback processing error: %s", _SYM_ERROR, e)
             return f"I'm sorry, there was an error processing your request: {str(e)}"
     
     def _import_entity(self, entity_name: str) -> bool:
@@ -581,19 +892,17 @@ class Sentinel:
         Returns:
             True if import successful, False otherwise
         """
+        # Known misses are not retried until forgotten
+        if entity_name in self._import_misses:
+            return False
+        
         try:
             # Try to import from vael_core
             module_path = f"vael_core.{entity_name}"
             module = importlib.import_module(module_path)
             
-            # Register entity
-            if hasattr(module, entity_name):
-                entity = getattr(module, entity_name)
-                self.register_entity(entity_name, entity)
-                return True
-            
-            # Entity might be the module itself
-            self.register_entity(entity_name, module)
+            # Register entity; it might be the module itself
+            self.register_entity(entity_name, getattr(module, entity_name, module))
             return True
         
         except ImportError:
@@ -602,31 +911,56 @@ class Sentinel:
                 module_path = f"src.{entity_name}"
                 module = importlib.import_module(module_path)
                 
-                # Register entity
-                if hasattr(module, entity_name):
-                    entity = getattr(module, entity_name)
-                    self.register_entity(entity_name, entity)
-                    return True
-                
-                # Entity might be the module itself
-                self.register_entity(entity_name, module)
+                # Register entity; it might be the module itself
+                self.register_entity(entity_name, getattr(module, entity_name, module))
                 return True
             
             except ImportError:
+                with self._import_lock:
+                    self._import_misses[entity_name] = None
+                    if len(self._import_misses) > _MAX_IMPORT_MISSES:
+                        self._import_misses.popitem(last=False)
                 return False
     
-    def _handle_heartbeat(self):
-        """Handle heartbeat command"""
-        self.last_heartbeat = time.time()
+    def forget_import(self, entity_name: str):
+        """
+        Forget a cached import failure so the entity is retried on next use
+        
+        Args:
+            entity_name: Entity name
+        """
+        with self._import_lock:
+            self._import_misses.pop(entity_name, None)
+    
+    def _pulse_loop(self):
+        """Refresh the pulse cache every heartbeat_interval until stopped"""
+        # One long-lived thread; the wait returns early as soon as stop() is called
+        while not self._pulse_stop.wait(self.heartbeat_interval):
+            try:
+                self._refresh_pulse()
+            except Exception as e:
+                logger.error("%s Pulse refresh failed: %s", _SYM_ERROR, e)
+    
+    def stop(self):
+        """Stop the background pulse refresh"""
+        self._pulse_stop.set()
+    
+    def _refresh_pulse(self):
+        """
+        Pulse all entities and cache healthy/unhealthy names
         
-        # Check entity health
+        Returns:
+            Tuple of (healthy, unhealthy) entity names
+        """
         healthy_entities = []
         unhealthy_entities = []
         
-        for name, entity in self.entities.items():
-            if hasattr(entity, 'pulse') and callable(entity.pulse):
+        pulse_fns = self._pulse_fns
+        for name in list(self.entities):
+            fn = pulse_fns.get(name)
+            if fn is not None:
                 try:
-                    result = entity.pulse()
+                    result = fn()
                     if result and (result is True or result.get('status') == 'healthy'):
                         healthy_entities.append(name)
                     else:
@@ -637,14 +971,27 @@ class Sentinel:
                 # Assume healthy if no pulse method
                 healthy_entities.append(name)
         
+        cache = (healthy_entities, unhealthy_entities)
+        self._pulse_cache = cache
+        self.last_heartbeat = time.time()
+        self._status_dirty = True
+        return cache
+    
+    def _handle_heartbeat(self):
+        """Handle heartbeat command with the cached pulse results"""
+        # Refresh now if entities changed since the last background pulse
+        cache = self._pulse_cache
+        if cache is None:
+            cache = self._refresh_pulse()
+        healthy_entities, unhealthy_entities = cache
+        
         # Emit heartbeat response
         if self.socket:
-            self.socket.emit('heartbeat', {
+            self._emit('heartbeat', {
                 'timestamp': self.last_heartbeat,
                 'healthy_entities': healthy_entities,
                 'unhealthy_entities': unhealthy_entities,
-                'status': 'success',
-                'symbol': SYMBOLS["SUCCESS"]
+                **_OK_SHELL
             })
     
     def _add_to_history(self, event_type: str, data: Any):
@@ -655,16 +1002,26 @@ class Sentinel:
             event_type: Event type
             data: Event data
         """
-        # Limit history size
-        if len(self.event_history) >= self.max_history:
-            self.event_history.pop(0)
+        # Add event (oldest entries are evicted by the deques)
+        timestamp = time.time()
+        with self._hist_lock:
+            self._hist_ts.append(timestamp)
+            self._hist_type.append(event_type)
+            self._hist_data.append(data)
+    
+    def history(self):
+        """
+        Iterate over recent events, oldest first
+        
+        Yields:
+            Event dictionaries with timestamp, type and data
+        """
+        # Snapshot all columns together; handler threads keep appending
+        with self._hist_lock:
+            columns = (tuple(self._hist_ts), tuple(self._hist_type), tuple(self._hist_data))
         
-        # Add event
-        self.event_history.append({
-            'timestamp': time.time(),
-            'type': event_type,
-            'data': data
-        })
+        for ts, event_type, data in zip(*columns):
+            yield {'timestamp': ts, 'type': event_type, 'data': data}
     
     def log_event(self, entity: str, message: str, level: str = 'info'):
         """
@@ -675,21 +1032,35 @@ class Sentinel:
             message: Log message
             level: Log level
         """
-        if level == 'debug':
-            logger.debug(f"{entity}: {message}")
-        elif level == 'info':
-            logger.info(f"{entity}: {message}")
-        elif level == 'warning':
-            logger.warning(f"{entity}: {message}")
-        elif level == 'error':
-            logger.error(f"{entity}: {message}")
-        elif level == 'critical':
-            logger.critical(f"{entity}: {message}")
-        else:
-            logger.info(f"{entity}: {message}")
+        lvl = _LOG_LEVELS.get(level, logging.INFO)
+        if logger.isEnabledFor(lvl):
+            logger.log(lvl, '%s: %s', entity, message)
+
+# Singleton instance, created on first use
+_sentinel = None
+_sentinel_lock = threading.Lock()
+
+def _get_sentinel() -> Sentinel:
+    """
+    Get the Sentinel singleton, creating and self-registering it on first use
+    
+    Returns:
+        Sentinel instance
+    """
+    global _sentinel
+    if _sentinel is None:
+        with _sentinel_lock:
+            if _sentinel is None:
+                instance = Sentinel()
+                instance.register_entity('sentinel', instance)
+                _sentinel = instance
+    return _sentinel
 
-# Create singleton instance
-sentinel = Sentinel()
+def __getattr__(name: str) -> Any:
+    # Keep `sentinel` available as a module attribute without creating it at import
+    if name == 'sentinel':
+        return _get_sentinel()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Public interface
 def register_entity(name: str, entity: Any) -> bool:
@@ -703,7 +1074,7 @@ def register_entity(name: str, entity: Any) -> bool:
     Returns:
         True if registration successful, False otherwise
     """
-    return sentinel.register_entity(name, entity)
+    return _get_sentinel().register_entity(name, entity)
 
 def register_route(route: str, handler: Callable) -> bool:
     """
@@ -716,7 +1087,7 @@ def register_route(route: str, handler: Callable) -> bool:
     Returns:
         True if registration successful, False otherwise
     """
-    return sentinel.register_route(route, handler)
+    return _get_sentinel().register_route(route, handler)
 
 def register_socket(socket):
     """
@@ -725,7 +1096,7 @@ def register_socket(socket):
     Args:
         socket: WebSocket interface object
     """
-    sentinel.register_socket(socket)
+    _get_sentinel().register_socket(socket)
 
 def log_event(entity: str, message: str, level: str = 'info'):
     """
@@ -736,7 +1107,16 @@ def log_event(entity: str, message: str, level: str = 'info'):
         message: Log message
         level: Log level
     """
-    sentinel.log_event(entity, message, level)
+    _get_sentinel().log_event(entity, message, level)
+
+def forget_import(name: str):
+    """
+    Forget a cached entity import failure
+    
+    Args:
+        name: Entity name
+    """
+    _get_sentinel().forget_import(name)
 
 def get_entity(name: str) -> Any:
     """
@@ -748,7 +1128,7 @@ def get_entity(name: str) -> Any:
     Returns:
         Entity object or None if not found
     """
-    return sentinel.entities.get(name)
+    return _get_sentinel().entities.get(name)
 
 def get_status():
     """
@@ -757,6 +1137,7 @@ def get_status():
     Returns:
         System status
     """
+    sentinel = _get_sentinel()
     return {
         'sentinel': {
             'status': sentinel.status,
@@ -779,13 +1160,14 @@ def pulse():
     Returns:
         Health status
     """
+    sentinel = _get_sentinel()
     return {
         'status': 'healthy',
         'timestamp': time.time(),
         'entities': list(sentinel.entities.keys()),
         'routes': list(sentinel.routes.keys()),
         'last_heartbeat': sentinel.last_heartbeat,
-        'symbol': SYMBOLS["SUCCESS"]
+        'symbol': _SYM_SUCCESS
     }
 
 # Initialize
@@ -799,8 +1181,5 @@ def init_sentinel(socket=None):
     if socket:
         register_socket(socket)
     
-    logger.info(f"{SYMBOLS['SUCCESS']} Sentinel initialization complete")
-    return sentinel
-
-# Register self
-register_entity('sentinel', sentinel)
+    logger.info("%s Sentinel initialization complete", _SYM_SUCCESS)
+    return _get_sentinel()
@@ -5,27 +5,37 @@ Connects the WebSocket server with VAEL Core entities,
 handles entity registration, discovery, and response aggregation.
 
 This module serves as the bridge between the Flask WebSocket interface
-and the modular VAEL Core entity system.
+and the modular VAEL Core entity system. Importing it has no side effects;
+the application entry point calls bootstrap() once at startup, otherwise
+entities are discovered on first use.
 """
 
 import os
+import re
 import sys
 import json
 import time
+import queue
+import atexit
+import hashlib
 import logging
+import pkgutil
 import importlib
+import importlib.util
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Any, Callable, Optional, Tuple, Union
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join('logs', 'sentinel_integration.log')),
-        logging.StreamHandler()
-    ]
-)
+# Log locations, resolved once against the project root rather than the CWD
+_ROOT = Path(__file__).resolve().parents[2]
+_LOG_DIR = _ROOT / 'logs'
+_DECISION_LOG_DIR = _LOG_DIR / 'decisions'
+_DECISION_LOG_PATH = _DECISION_LOG_DIR / 'decisions.jsonl'
+
 logger = logging.getLogger('sentinel.integration')
 
 # Symbolic indicators for token efficiency
@@ -49,18 +59,88 @@ SYMBOLS = {
     'system': '🖥️',
     'analysis': '🔍',
     'decision': '🧩',
+    'command': '⌨️',
 }
 
-# Entity registry
-_entities = {}
-_entity_status = {}
-_last_pulse = {}
-_decision_log = []
+# Symbols used on logging paths, bound once
+_SYM_SUCCESS = SYMBOLS['success']
+_SYM_WARNING = SYMBOLS['warning']
+_SYM_ERROR = SYMBOLS['error']
+_SYM_INFO = SYMBOLS['info']
+_SYM_HEALTH = SYMBOLS['health']
+_SYM_COMMAND = SYMBOLS['command']
+
+# Shared compact encoder; json.dumps would rebuild one for non-default options
+_dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+# Response keys in precedence order; 'result' is last and gets serialized
+_RESPONSE_KEYS = ('message', 'response', 'result')
+_SCALAR_TYPES = (str, int, float, bool)
+
+@dataclass(slots=True)
+class _EntityRecord:
+    """Registry entry holding everything the integration layer tracks per entity."""
+    module: Any  # None if the entity failed to import
+    status: str = 'registered'
+    last_pulse: float = 0.0  # time.monotonic() of the last pulse
+    caps: frozenset = frozenset()  # the _CAPABILITIES the module provides
+    methods: Dict[str, Callable] = field(default_factory=dict)  # resolved by execute_entity_method
+
+# Entity registry: one record per name, so routing needs a single lookup
+_entities: Dict[str, _EntityRecord] = {}
+
+# Security keywords that route a message to NEXUS, matched in one pass over
+# the casefolded head of the message
+_SECURITY_RE = re.compile(r'security|threat|attack|vulnerability|breach|hack')
+_ROUTING_SCAN_LIMIT = 4096
+
+# Package scanned by discover_entities() and the entities it may provide
+_ENTITY_PACKAGE = 'vael_core'
+_POTENTIAL_ENTITIES = (
+    'sentinel', 'nexus', 'watchdog', 'twin_flame',
+    'local_vael', 'manus_interface'
+)
+
+# Entity methods the integration layer calls on hot paths; probed once at registration
+_CAPABILITIES = ('pulse', 'process', 'can_process', 'handle_command')
+
+# Batch health checks pulse entities in parallel, each bounded by this timeout
+_HEALTH_TIMEOUT = 2.0
+_HEALTH_MAX_WORKERS = 8
+
+# Shared pool for health pulses; one slow or hung pulse ties up at most one of
+# its workers instead of stranding a new pool per check
+_health_executor = ThreadPoolExecutor(
+    max_workers=_HEALTH_MAX_WORKERS,
+    thread_name_prefix='sentinel-health'
+)
+atexit.register(_health_executor.shutdown, wait=False, cancel_futures=True)
 
 # Maximum size for circular buffers to maintain token efficiency
 MAX_LOG_SIZE = 10
 MAX_DECISION_LOG_SIZE = 20
 
+_decision_log = deque(maxlen=MAX_DECISION_LOG_SIZE)
+
+# Entities are discovered by bootstrap(), or else on first use
+_initialized = False
+_initializing = False  # Set while initialize() runs, for its own reentrant calls
+_init_lock = threading.RLock()
+
+# Append-only decision log, written by a background thread started on first use
+_decision_file = None
+_decision_queue = queue.Queue()
+_decision_lock = threading.Lock()  # Guards starting the writer
+
+# Most records the writer encodes and writes per wakeup
+_DECISION_BATCH_SIZE = 128
+
+# ', '-joined loaded entity names for error messages; None until rebuilt
+_entities_joined = None
+
+# (epoch second, ISO string) for the last decision timestamp; swapped as one tuple
+_ts_cache = (0, '')
+
 class EntityNotFoundError(Exception):
     """Raised when an entity is not found in the registry."""
     pass
@@ -80,35 +160,138 @@ def register_entity(name: str, module_path: str) -> bool:
     Returns:
         bool: True if registration was successful, False otherwise
     """
-    global _entities, _entity_status, _last_pulse
+    try:
+        # Probe first so a missing module costs a finder walk, not a raised ImportError
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError):
+        # Missing parent package or malformed path
+        spec = None
+    
+    if spec is None:
+        logger.error("%s Failed to register entity '%s': No module named '%s'", _SYM_ERROR, name, module_path)
+        _mark_error(name)
+        return False
     
+    return _register_spec(name, spec)
+
+def _register_spec(name: str, spec) -> bool:
+    """
+    Import an entity from an already-resolved module spec and register it.
+    
+    Args:
+        name: The name of the entity
+        spec: The ModuleSpec returned by importlib.util.find_spec
+        
+    Returns:
+        bool: True if registration was successful, False otherwise
+    """
+    module_path = spec.name
     try:
-        # Lazy import to save tokens
+        # Lazy import to save tokens; the spec only proved the module exists,
+        # the import system does the load (module locks, parent binding)
         module = importlib.import_module(module_path)
-        _entities[name] = module
-        _entity_status[name] = 'registered'
-        _last_pulse[name] = time.time()
+        record = _EntityRecord(
+            module,
+            last_pulse=time.monotonic(),
+            caps=frozenset(
+                method for method in _CAPABILITIES if callable(getattr(module, method, None))
+            )
+        )
+        _entities[name] = record
+        _invalidate_entities_joined()
         
         # Log registration with symbolic indicator for token efficiency
-        logger.info(f"{SYMBOLS['success']} Entity '{name}' registered from {module_path}")
+        logger.info("%s Entity '%s' registered from %s", _SYM_SUCCESS, name, module_path)
         
         # Run initial pulse check if available
-        if hasattr(module, 'pulse') and callable(module.pulse):
+        if 'pulse' in record.caps:
             pulse_result = module.pulse()
-            _last_pulse[name] = time.time()
-            _entity_status[name] = 'active' if pulse_result.get('status') == 'healthy' else 'warning'
-            logger.info(f"{SYMBOLS['health']} Initial pulse for '{name}': {_entity_status[name]}")
+            record.last_pulse = time.monotonic()
+            record.status = 'active' if pulse_result.get('status') == 'healthy' else 'warning'
+            logger.info("%s Initial pulse for '%s': %s", _SYM_HEALTH, name, record.status)
         
         return True
     except ImportError as e:
-        logger.error(f"{SYMBOLS['error']} Failed to register entity '{name}': {str(e)}")
-        _entity_status[name] = 'error'
+        logger.error("%s Failed to register entity '%s': %s", _SYM_ERROR, name, e)
+        _mark_error(name)
         return False
     except Exception as e:
-        logger.error(f"{SYMBOLS['error']} Unexpected error registering '{name}': {str(e)}")
-        _entity_status[name] = 'error'
+        logger.error("%s Unexpected error registering '%s': %s", _SYM_ERROR, name, e)
+        _mark_error(name)
         return False
 
+def _mark_error(name: str) -> None:
+    """
+    Flag an entity as errored, keeping any module it was previously registered with.
+    
+    Args:
+        name: The name of the entity
+    """
+    record = _entities.get(name)
+    if record is None:
+        _entities[name] = _EntityRecord(None, status='error')
+    else:
+        record.status = 'error'
+
+def _get_record(name: str) -> _EntityRecord:
+    """
+    Get the registry record of a loaded entity.
+    
+    Args:
+        name: The name of the entity
+        
+    Returns:
+        _EntityRecord: The entity's record
+        
+    Raises:
+        EntityNotFoundError: If the entity isn't registered or failed to import
+    """
+    record = _entities.get(name)
+    if record is None or record.module is None:
+        raise EntityNotFoundError(f"Entity '{name}' not found")
+    return record
+
+def _is_routable(name: str, method: str) -> bool:
+    """
+    Check whether an entity is active and provides the method a message would be routed to.
+    
+    Args:
+        name: The name of the entity
+        method: One of _CAPABILITIES
+        
+    Returns:
+        bool: True if the message can be routed to the entity
+    """
+    record = _entities.get(name)
+    return record is not None and record.status == 'active' and method in record.caps
+
+def _loaded_entities() -> List[str]:
+    """
+    List the names of entities whose modules were imported.
+    
+    Returns:
+        List[str]: The entity names
+    """
+    return [name for name, record in _entities.items() if record.module is not None]
+
+def _invalidate_entities_joined() -> None:
+    """Drop the cached entity list text after the registry changes."""
+    global _entities_joined
+    _entities_joined = None
+
+def _entities_text() -> str:
+    """
+    Get the loaded entity names as one comma-separated string.
+    
+    Returns:
+        str: The joined names, rebuilt only after a registration
+    """
+    global _entities_joined
+    joined = _entities_joined
+    if joined is None:
+        joined = _entities_joined = ', '.join(_loaded_entities())
+    return joined
+
 def discover_entities() -> Dict[str, str]:
     """
     Automatically discover and register available entities.
@@ -116,24 +299,26 @@ def discover_entities() -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary of entity names and their status
     """
-    # Base path for entity discovery
-    base_path = 'vael_core'
+    try:
+        package = importlib.import_module(_ENTITY_PACKAGE)
+    except ImportError as e:
+        logger.warning("%s Error discovering entities in '%s': %s", _SYM_WARNING, _ENTITY_PACKAGE, e)
+        return get_entity_status()
     
-    # Potential entities to discover
-    potential_entities = [
-        'sentinel', 'nexus', 'watchdog', 'twin_flame', 
-        'local_vael', 'manus_interface'
-    ]
+    # One directory listing instead of a finder walk per candidate; absent
+    # entities are never probed or imported
+    present = {info.name: info for info in pkgutil.iter_modules(package.__path__)}
     
-    for entity in potential_entities:
-        module_path = f"{base_path}.{entity}"
-        try:
-            # Check if the module exists before attempting to import
-            spec = importlib.util.find_spec(module_path)
-            if spec is not None:
-                register_entity(entity, module_path)
-        except Exception as e:
-            logger.warning(f"{SYMBOLS['warning']} Error discovering entity '{entity}': {str(e)}")
+    for entity in _POTENTIAL_ENTITIES:
+        info = present.get(entity)
+        if info is None:
+            continue
+        
+        # The listing came from this finder, so the existence probe skips a
+        # sys.meta_path walk; _register_spec logs and flags import failures
+        spec = info.module_finder.find_spec(f"{_ENTITY_PACKAGE}.{entity}")
+        if spec is not None:
+            _register_spec(entity, spec)
     
     return get_entity_status()
 
@@ -144,7 +329,8 @@ def get_entity_status() -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary of entity names and their status
     """
-    return _entity_status.copy()
+    _ensure_initialized()
+    return {name: record.status for name, record in _entities.items()}
 
 def check_entity_health(name: str = None) -> Dict[str, Any]:
     """
@@ -156,29 +342,67 @@ def check_entity_health(name: str = None) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Health status information
     """
+    _ensure_initialized()
     if name is not None:
-        if name not in _entities:
-            raise EntityNotFoundError(f"Entity '{name}' not found")
-        
-        entity = _entities[name]
-        if hasattr(entity, 'pulse') and callable(entity.pulse):
-            try:
-                result = entity.pulse()
-                _last_pulse[name] = time.time()
-                _entity_status[name] = 'active' if result.get('status') == 'healthy' else 'warning'
-                return {name: result}
-            except Exception as e:
-                logger.error(f"{SYMBOLS['error']} Error checking health of '{name}': {str(e)}")
-                _entity_status[name] = 'error'
-                return {name: {'status': 'error', 'message': str(e)}}
+        return {name: _check_one(name, _get_record(name))}
+    
+    # Check all entities; pulses run concurrently so one slow entity can't stall the rest
+    results = {}
+    pending = []
+    for entity_name, record in list(_entities.items()):
+        if record.module is None:
+            continue
+        if 'pulse' in record.caps:
+            pending.append((entity_name, record))
         else:
-            return {name: {'status': 'unknown', 'message': 'No pulse method available'}}
-    else:
-        # Check all entities
-        results = {}
-        for entity_name in _entities:
-            results.update(check_entity_health(entity_name))
+            results[entity_name] = _check_one(entity_name, record)
+    
+    if not pending:
         return results
+    
+    futures = [
+        (entity_name, _health_executor.submit(_check_one, entity_name, record))
+        for entity_name, record in pending
+    ]
+    deadline = time.monotonic() + _HEALTH_TIMEOUT
+    for entity_name, future in futures:
+        try:
+            results[entity_name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            # Drop it if it never started; a running pulse finishes and
+            # updates its record later
+            future.cancel()
+            logger.warning("%s Health check of '%s' timed out", _SYM_WARNING, entity_name)
+            results[entity_name] = {'status': 'timeout'}
+    return results
+
+def _check_one(name: str, record: _EntityRecord) -> Dict[str, Any]:
+    """
+    Pulse one entity and update its record.
+    
+    Args:
+        name: The name of the entity
+        record: The entity's registry record
+        
+    Returns:
+        Dict[str, Any]: The entity's pulse result
+    """
+    if 'pulse' not in record.caps:
+        return {'status': 'unknown', 'message': 'No pulse method available'}
+    
+    pulse = record.methods.get('pulse')
+    if pulse is None:
+        pulse = record.methods['pulse'] = record.module.pulse
+    
+    try:
+        result = pulse()
+        record.last_pulse = time.monotonic()
+        record.status = 'active' if result.get('status') == 'healthy' else 'warning'
+        return result
+    except Exception as e:
+        logger.error("%s Error checking health of '%s': %s", _SYM_ERROR, name, e)
+        record.status = 'error'
+        return {'status': 'error', 'message': str(e)}
 
 def execute_entity_method(entity_name: str, method_name: str, *args, **kwargs) -> Any:
     """
@@ -192,23 +416,25 @@ def execute_entity_method(entity_name: str, method_name: str, *args, **kwargs) -
     Returns:
         Any: The result of the method execution
     """
-    if entity_name not in _entities:
-        raise EntityNotFoundError(f"Entity '{entity_name}' not found")
-    
-    entity = _entities[entity_name]
+    _ensure_initialized()
+    record = _get_record(entity_name)
     
-    # Check if entity has the requested method
-    if not hasattr(entity, method_name) or not callable(getattr(entity, method_name)):
-        logger.error(f"{SYMBOLS['error']} Method '{method_name}' not found on entity '{entity_name}'")
-        return {'status': 'error', 'message': f"Method '{method_name}' not found"}
+    # Resolve the method once per registration; re-registering starts a fresh record
+    try:
+        method = record.methods[method_name]
+    except KeyError:
+        method = getattr(record.module, method_name, None)
+        if not callable(method):
+            logger.error("%s Method '%s' not found on entity '%s'", _SYM_ERROR, method_name, entity_name)
+            return {'status': 'error', 'message': f"Method '{method_name}' not found"}
+        record.methods[method_name] = method
     
     # Execute the method
     try:
-        method = getattr(entity, method_name)
         result = method(*args, **kwargs)
         return result
     except Exception as e:
-        logger.error(f"{SYMBOLS['error']} Error executing '{method_name}' on '{entity_name}': {str(e)}")
+        logger.error("%s Error executing '%s' on '%s': %s", _SYM_ERROR, method_name, entity_name, e)
         return {'status': 'error', 'message': str(e)}
 
 def process_message(message: str, source: str = 'user') -> Dict[str, Any]:
@@ -222,8 +448,9 @@ def process_message(message: str, source: str = 'user') -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: The processed response
     """
+    _ensure_initialized()
     # Log the incoming message with token-efficient format
-    logger.info(f"{SYMBOLS['info']} Processing message from {source}: {message[:50]}...")
+    logger.info("%s Processing message from %s: %s...", _SYM_INFO, source, message[:50])
     
     # Check if this is a command directed at a specific entity
     if message.startswith('/'):
@@ -234,7 +461,7 @@ def process_message(message: str, source: str = 'user') -> Dict[str, Any]:
     # In a full implementation, this would use NLP or pattern matching
     
     # First, check if Twin Flame should process this (complex reasoning)
-    if 'twin_flame' in _entities and _entity_status.get('twin_flame') == 'active':
+    if _is_routable('twin_flame', 'can_process'):
         # Ask Twin Flame if it can handle this message
         can_handle = execute_entity_method('twin_flame', 'can_process', message)
         if can_handle.get('result', False):
@@ -243,20 +470,19 @@ def process_message(message: str, source: str = 'user') -> Dict[str, Any]:
             return result
     
     # Next, check if this is a security-related message for NEXUS
-    security_keywords = ['security', 'threat', 'attack', 'vulnerability', 'breach', 'hack']
-    if 'nexus' in _entities and _entity_status.get('nexus') == 'active' and any(kw in message.lower() for kw in security_keywords):
+    if _is_routable('nexus', 'process') and _SECURITY_RE.search(message[:_ROUTING_SCAN_LIMIT].casefold()):
         result = execute_entity_method('nexus', 'process', message)
         log_decision('nexus', message, result)
         return result
     
     # Default to local_vael for general processing
-    if 'local_vael' in _entities and _entity_status.get('local_vael') == 'active':
+    if _is_routable('local_vael', 'process'):
         result = execute_entity_method('local_vael', 'process', message)
         log_decision('local_vael', message, result)
         return result
     
     # Fallback to a simple response if no entity can handle it
-    logger.warning(f"{SYMBOLS['warning']} No suitable entity found to process message")
+    logger.warning("%s No suitable entity found to process message", _SYM_WARNING)
     return {
         'status': 'fallback',
         'message': "I'm processing your request. Please wait while I connect to the appropriate system.",
@@ -274,31 +500,27 @@ def process_command(command: str, source: str = 'user') -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: The command response
     """
-    parts = command[1:].split(' ', 1)
-    entity_name = parts[0].lower()
-    cmd = parts[1] if len(parts) > 1 else 'help'
+    _ensure_initialized()
+    entity_name, sep, cmd = command[1:].partition(' ')
+    entity_name = entity_name.lower()
+    if not sep:
+        cmd = 'help'
     
-    logger.info(f"{SYMBOLS['command']} Processing command for {entity_name}: {cmd}")
+    logger.info("%s Processing command for %s: %s", _SYM_COMMAND, entity_name, cmd)
     
     # Check if the entity exists
-    if entity_name not in _entities:
+    record = _entities.get(entity_name)
+    if record is None or record.module is None:
         return {
             'status': 'error',
-            'message': f"Entity '{entity_name}' not found. Available entities: {', '.join(_entities.keys())}",
+            'message': f"Entity '{entity_name}' not found. Available entities: {_entities_text()}",
             'source': 'sentinel_integration'
         }
     
     # Special commands that don't require the entity to handle them
-    if cmd == 'status':
-        status = _entity_status.get(entity_name, 'unknown')
-        last_pulse_time = _last_pulse.get(entity_name, 0)
-        time_since_pulse = time.time() - last_pulse_time
-        
-        return {
-            'status': 'success',
-            'message': f"Entity '{entity_name}' status: {status}. Last pulse: {time_since_pulse:.1f}s ago.",
-            'source': 'sentinel_integration'
-        }
+    handler = _LOCAL_COMMANDS.get(cmd)
+    if handler is not None:
+        return handler(entity_name)
     
     # Forward the command to the entity
     try:
@@ -306,13 +528,52 @@ def process_command(command: str, source: str = 'user') -> Dict[str, Any]:
         log_decision(entity_name, command, result)
         return result
     except Exception as e:
-        logger.error(f"{SYMBOLS['error']} Error processing command '{cmd}' for '{entity_name}': {str(e)}")
+        logger.error("%s Error processing command '%s' for '%s': %s", _SYM_ERROR, cmd, entity_name, e)
         return {
             'status': 'error',
             'message': f"Error processing command: {str(e)}",
             'source': 'sentinel_integration'
         }
 
+def _command_status(entity_name: str) -> Dict[str, Any]:
+    """
+    Report an entity's registry status without involving the entity.
+    
+    Args:
+        entity_name: The name of the entity
+        
+    Returns:
+        Dict[str, Any]: The command response
+    """
+    record = _entities[entity_name]
+    time_since_pulse = time.monotonic() - record.last_pulse
+    
+    return {
+        'status': 'success',
+        'message': f"Entity '{entity_name}' status: {record.status}. Last pulse: {time_since_pulse:.1f}s ago.",
+        'source': 'sentinel_integration'
+    }
+
+# Commands answered by the integration layer itself, keyed by command
+_LOCAL_COMMANDS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    'status': _command_status,
+}
+
+def _now_iso() -> str:
+    """
+    Return the local time as an ISO string at one-second resolution.
+    
+    Decisions logged within the same second share one cached string.
+    """
+    global _ts_cache
+    sec = int(time.time())
+    cached = _ts_cache
+    if cached[0] == sec:
+        return cached[1]
+    stamp = datetime.fromtimestamp(sec).isoformat()
+    _ts_cache = (sec, stamp)
+    return stamp
+
 def log_decision(entity: str, input_data: str, output_data: Any) -> None:
     """
     Log a decision made by an entity for auditing and analysis.
@@ -322,38 +583,99 @@ def log_decision(entity: str, input_data: str, output_data: Any) -> None:
         input_data: The input that led to the decision
         output_data: The output/decision made
     """
-    global _decision_log
-    
     # Create a token-efficient log entry
     entry = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _now_iso(),
         'entity': entity,
-        'input_hash': hash(input_data),  # Use hash for token efficiency
+        # Short, stable digest; hash() is salted per process so can't be correlated across runs
+        'input_hash': hashlib.blake2b(input_data.encode('utf-8', 'replace'), digest_size=8).hexdigest(),
         'output_type': type(output_data).__name__,
         'status': output_data.get('status', 'unknown') if isinstance(output_data, dict) else 'unknown'
     }
     
-    # Add to circular buffer for token efficiency
+    # Add to circular buffer for token efficiency; the deque evicts the oldest
     _decision_log.append(entry)
-    if len(_decision_log) > MAX_DECISION_LOG_SIZE:
-        _decision_log.pop(0)
-    
-    # Write to log file
-    log_dir = os.path.join('logs', 'decisions')
-    os.makedirs(log_dir, exist_ok=True)
     
-    log_file = os.path.join(log_dir, f"decision_{int(time.time())}.json")
+    # Stringify the output once; it can be a large nested structure
+    output_text = str(output_data)
     try:
-        with open(log_file, 'w') as f:
-            json.dump({
-                'timestamp': entry['timestamp'],
-                'entity': entity,
-                'input': input_data[:100] + '...' if len(input_data) > 100 else input_data,
-                'output': str(output_data)[:100] + '...' if len(str(output_data)) > 100 else str(output_data),
-                'status': entry['status']
-            }, f)
+        if _decision_file is None:
+            _start_decision_writer()
+        
+        # Hand off to the writer thread; no file I/O on the caller's path
+        _decision_queue.put_nowait({
+            'timestamp': entry['timestamp'],
+            'entity': entity,
+            'input': input_data[:100] + '...' if len(input_data) > 100 else input_data,
+            'output': output_text[:100] + '...' if len(output_text) > 100 else output_text,
+            'status': entry['status']
+        })
     except Exception as e:
-        logger.error(f"{SYMBOLS['error']} Error writing decision log: {str(e)}")
+        logger.error("%s Error writing decision log: %s", _SYM_ERROR, e)
+
+def _start_decision_writer() -> None:
+    """
+    Open decisions.jsonl and start the thread that appends queued records to it.
+    """
+    global _decision_file
+    
+    with _decision_lock:
+        if _decision_file is not None:
+            return
+        
+        _DECISION_LOG_DIR.mkdir(parents=True, exist_ok=True)
+        decision_file = open(_DECISION_LOG_PATH, 'a', encoding='utf-8', buffering=1 << 15)
+        threading.Thread(
+            target=_decision_writer_loop, args=(decision_file,),
+            name='decision-writer', daemon=True
+        ).start()
+        atexit.register(_close_decision_log, decision_file)
+        _decision_file = decision_file
+
+def _decision_writer_loop(decision_file) -> None:
+    """
+    Append queued decision records as JSON lines, one write per batch.
+    
+    The file is flushed whenever the queue runs dry, so records reach disk
+    promptly once a burst is over.
+    
+    Args:
+        decision_file: The open decisions.jsonl file object
+    """
+    while True:
+        batch = [_decision_queue.get()]
+        try:
+            while len(batch) < _DECISION_BATCH_SIZE:
+                batch.append(_decision_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        try:
+            decision_file.write(''.join(_dumps(record) + '\n' for record in batch))
+            if _decision_queue.empty():
+                decision_file.flush()
+        except Exception as e:
+            logger.error("%s Error writing decision log: %s", _SYM_ERROR, e)
+        finally:
+            for _ in batch:
+                _decision_queue.task_done()
+
+def _close_decision_log(decision_file) -> None:
+    """
+    Wait for queued records to be written, then close the file. Runs at exit.
+    
+    Args:
+        decision_file: The open decisions.jsonl file object
+    """
+    _decision_queue.join()
+    decision_file.close()
+
+def flush_decisions() -> None:
+    """
+    Block until every queued decision record has been written and flushed.
+    """
+    if _decision_file is not None:
+        _decision_queue.join()
 
 def format_response(entity_response: Dict[str, Any]) -> str:
     """
@@ -367,20 +689,44 @@ def format_response(entity_response: Dict[str, Any]) -> str:
     """
     # Extract the message from the response
     if isinstance(entity_response, dict):
-        if 'message' in entity_response:
-            return entity_response['message']
-        elif 'response' in entity_response:
-            return entity_response['response']
-        elif 'result' in entity_response:
-            result = entity_response['result']
-            if isinstance(result, (str, int, float, bool)):
-                return str(result)
-            else:
-                return json.dumps(result)
+        key = next((k for k in _RESPONSE_KEYS if k in entity_response), None)
+        if key is not None:
+            value = entity_response[key]
+            if key != 'result':
+                return value
+            return str(value) if isinstance(value, _SCALAR_TYPES) else _dumps(value)
     
     # Fallback to string representation
     return str(entity_response)
 
+def configure_logging() -> None:
+    """
+    Send log output to logs/sentinel_integration.log and the console.
+    
+    Importing this module leaves logging alone; application entry points
+    opt in by calling this (or bootstrap()).
+    """
+    _LOG_DIR.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(_LOG_DIR / 'sentinel_integration.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+def _ensure_initialized() -> None:
+    """
+    Run initialize() once, on first use, if bootstrap() hasn't already.
+    """
+    if not _initialized:
+        # Other threads wait here until discovery has finished; the thread
+        # running initialize() re-enters the lock and carries on
+        with _init_lock:
+            if not _initialized and not _initializing:
+                initialize()
+
 def initialize() -> bool:
     """
     Initialize the integration system and discover entities.
@@ -388,22 +734,42 @@ def initialize() -> bool:
     Returns:
         bool: True if initialization was successful, False otherwise
     """
-    try:
-        logger.info(f"{SYMBOLS['info']} Initializing Sentinel integration module")
-        discover_entities()
-        
-        # Log the discovered entities
-        status = get_entity_status()
-        logger.info(f"{SYMBOLS['success']} Discovered entities: {json.dumps(status)}")
-        
-        # Check health of all entities
-        health = check_entity_health()
-        logger.info(f"{SYMBOLS['health']} Entity health check complete")
-        
-        return True
-    except Exception as e:
-        logger.error(f"{SYMBOLS['error']} Error initializing integration module: {str(e)}")
-        return False
+    global _initialized, _initializing
+    
+    with _init_lock:
+        # Discovery below goes through the public accessors, which must not
+        # start a nested initialize(); _initialized is only published once
+        # the registry is complete
+        _initializing = True
+        try:
+            logger.info("%s Initializing Sentinel integration module", _SYM_INFO)
+            discover_entities()
+            
+            # Log the discovered entities
+            status = get_entity_status()
+            logger.info("%s Discovered entities: %s", _SYM_SUCCESS, _dumps(status))
+            
+            # Check health of all entities
+            health = check_entity_health()
+            logger.info("%s Entity health check complete", _SYM_HEALTH)
+            
+            return True
+        except Exception as e:
+            logger.error("%s Error initializing integration module: %s", _SYM_ERROR, e)
+            return False
+        finally:
+            _initializing = False
+            _initialized = True
 
-# Initialize on import
-initialize()
+def bootstrap() -> bool:
+    """
+    Configure logging and initialize the integration system.
+    
+    Call once from the application entry point. Without it, entities are
+    discovered on the first call that needs them.
+    
+    Returns:
+        bool: True if initialization was successful, False otherwise
+    """
+    configure_logging()
+    return initialize()
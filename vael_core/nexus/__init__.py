@@ -11,9 +11,12 @@ Token-efficient implementation with symbolic compression and limited scan cycles
 import time
 import os
 import json
+import hashlib
 import logging
+import threading
 from collections import deque
-from typing import Dict, List, Tuple, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Tuple, Any, Optional
 
 # Configure logging
 logger = logging.getLogger("vael.nexus")
@@ -42,6 +45,43 @@ THREAT_LEVELS = {
     5: "CRITICAL"    # Critical threat, immediate action required
 }
 
+# Constant head of every scan result's symbolic tag
+_SCAN_SYMBOLIC_PREFIX = f"{SYMBOLS['CLEAR']} SIGMA/SCAN/"
+
+# Expected SHA-256 digests of the NEXUS files, relative to the package dir
+_INTEGRITY_MANIFEST = os.path.join('signatures', 'nexus_integrity.json')
+_HASH_CHUNK_SIZE = 1 << 20
+
+def _file_sha256(path: str) -> str:
+    """Hash a file with SHA-256
+    
+    Args:
+        path: File to hash
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        # Stream through one reusable buffer instead of a new bytes per read
+        digest = hashlib.sha256()
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+        return digest.hexdigest()
+
+# Shared, read-only answer for throttled scans
+_SCAN_RATE_LIMITED = MappingProxyType({
+    "status": "RATE_LIMITED",
+    "message": f"{SYMBOLS['BLOCK']} Scan rate limited"
+})
+
 class NEXUS:
     """NEXUS Intrusion Detection System for VAEL Core"""
     
@@ -53,18 +93,26 @@ class NEXUS:
         """
         self.initialized = False
         self.high_alert_mode = False
-        self.last_scan_time = 0
+        self.last_scan_time = 0  # time.monotonic() of the last accepted scan
         self.scan_interval = 1.0  # Default: 1 scan per second
         self.high_alert_scan_interval = 0.2  # 5 scans per second in high alert mode
         
         # Rolling memory buffer (10 entries for token efficiency)
         self.memory_buffer = deque(maxlen=10)
+        self._memory_snapshot = None  # Cached get_memory() result; None when stale
         
         # Known intrusion signatures (lazy-loaded via sync)
         self.signatures = {}
         
+        # Sentinel/Manus log_event callables, resolved once config is loaded
+        self._event_sinks = None
+        
+        # Antibody heal callable, bound when registering with Antibody
+        self._antibody_heal = None
+        
         # Load configuration
         self.config = self._load_config(config_path)
+        self._self_healing = bool(self.config.get("self_healing", True))
         
         # Register with other entities
         self._register_with_sentinel()
@@ -123,13 +171,37 @@ class NEXUS:
         nexus_dir = os.path.dirname(os.path.abspath(__file__))
         required_files = ['__init__.py', 'pulse.py', 'sync.py', 'suggest.py']
         
-        for file in required_files:
-            file_path = os.path.join(nexus_dir, file)
-            if not os.path.exists(file_path):
-                self._log_event(f"{SYMBOLS['BREACH']} NEXUS file missing: {file}")
-                return False
+        # One directory read instead of a stat per file
+        try:
+            with os.scandir(nexus_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        
+        missing = [file for file in required_files if file not in present]
+        if missing:
+            self._log_event(f"{SYMBOLS['BREACH']} NEXUS file missing: {', '.join(missing)}")
+            return False
         
-        # TODO: Add file integrity checks (hash validation)
+        # Verify file integrity against the manifest, when one is installed
+        manifest_path = os.path.join(nexus_dir, _INTEGRITY_MANIFEST)
+        if os.path.exists(manifest_path):
+            # A manifest that is present but unusable fails validation: breaking
+            # it must not be a way around the check
+            try:
+                with open(manifest_path, 'r') as f:
+                    expected_hashes = json.load(f)
+                if not isinstance(expected_hashes, dict):
+                    raise ValueError("manifest is not a mapping")
+                
+                for file in required_files:
+                    expected = expected_hashes.get(file)
+                    if expected and _file_sha256(os.path.join(nexus_dir, file)) != expected.lower():
+                        self._log_event(f"{SYMBOLS['BREACH']} NEXUS integrity check failed: {file}")
+                        return False
+            except (OSError, ValueError, AttributeError) as e:
+                self._log_event(f"{SYMBOLS['BREACH']} Failed to verify NEXUS integrity: {str(e)}")
+                return False
         
         # Basic self-test of functionality
         try:
@@ -158,8 +230,9 @@ class NEXUS:
         """Register NEXUS with Antibody for self-healing"""
         try:
             # Import here to avoid circular imports
-            from vael_core.antibody_interface import register_entity
+            from vael_core.antibody_interface import register_entity, heal
             register_entity('nexus', self)
+            self._antibody_heal = heal
             self._log_event(f"{SYMBOLS['HEAL']} Registered with Antibody")
         except ImportError:
             self._log_event(f"{SYMBOLS['SUSPICIOUS']} Failed to register with Antibody")
@@ -173,17 +246,18 @@ class NEXUS:
         Returns:
             Scan results with threat assessment
         """
-        current_time = time.time()
+        now = time.monotonic()
         interval = self.high_alert_scan_interval if self.high_alert_mode else self.scan_interval
         
-        # Enforce scan rate limits
-        if current_time - self.last_scan_time < interval:
-            return {"status": "RATE_LIMITED", "message": f"{SYMBOLS['BLOCK']} Scan rate limited"}
+        # Enforce scan rate limits on the monotonic clock
+        if now - self.last_scan_time < interval:
+            return _SCAN_RATE_LIMITED
         
-        self.last_scan_time = current_time
+        self.last_scan_time = now
+        current_time = time.time()
         
         # Perform the scan
-        self._log_event(f"{SYMBOLS['SCAN']} Scanning {'target' if target else 'system'}")
+        self._log_event("%s Scanning %s", SYMBOLS['SCAN'], 'target' if target else 'system')
         
         # TODO: Implement actual scanning logic
         # For now, return a placeholder result
@@ -193,7 +267,7 @@ class NEXUS:
             "threat_level": 0,
             "threat_name": THREAT_LEVELS[0],
             "findings": [],
-            "symbolic": f"{SYMBOLS['CLEAR']} SIGMA/SCAN/{current_time}"
+            "symbolic": _SCAN_SYMBOLIC_PREFIX + str(current_time)
         }
         
         # Add to memory buffer
@@ -209,7 +283,7 @@ class NEXUS:
         """
         self.high_alert_mode = enabled
         status = "enabled" if enabled else "disabled"
-        self._log_event(f"{SYMBOLS['ALERT' if enabled else 'CLEAR']} High alert mode {status}")
+        self._log_event("%s High alert mode %s", SYMBOLS['ALERT' if enabled else 'CLEAR'], status)
     
     def add_to_memory(self, entry: Any):
         """Add entry to memory buffer
@@ -226,19 +300,23 @@ class NEXUS:
             entry['timestamp'] = time.time()
         
         self.memory_buffer.append(entry)
+        self._memory_snapshot = None
     
-    def get_memory(self) -> List:
+    def get_memory(self) -> Tuple:
         """Get contents of memory buffer
         
         Returns:
-            List of memory entries
+            Read-only snapshot of memory entries, shared until the buffer changes
         """
-        return list(self.memory_buffer)
+        if self._memory_snapshot is None:
+            self._memory_snapshot = tuple(self.memory_buffer)
+        return self._memory_snapshot
     
     def clear_memory(self):
         """Clear memory buffer"""
         self.memory_buffer.clear()
-        self._log_event(f"{SYMBOLS['CLEAR']} Memory buffer cleared")
+        self._memory_snapshot = None
+        self._log_event("%s Memory buffer cleared", SYMBOLS['CLEAR'])
     
     def _emit_alert(self, alert_type: str, severity: str, message: str):
         """Emit an alert
@@ -268,10 +346,10 @@ class NEXUS:
         self.add_to_memory(alert)
         
         # Log the alert
-        self._log_event(f"{symbol} {alert_type} ({severity}): {message}")
+        self._log_event("%s %s (%s): %s", symbol, alert_type, severity, message)
         
         # Trigger self-healing if needed
-        if severity in ["CRITICAL", "HIGH"] and self.config.get("self_healing", True):
+        if severity in ["CRITICAL", "HIGH"] and self._self_healing:
             self._trigger_self_healing(alert)
     
     def _trigger_self_healing(self, alert: Dict):
@@ -280,42 +358,92 @@ class NEXUS:
         Args:
             alert: Alert that triggered healing
         """
-        try:
-            # Import here to avoid circular imports
-            from vael_core.antibody_interface import heal
-            
-            self._log_event(f"{SYMBOLS['HEAL']} Triggering self-healing for {alert['type']}")
-            heal('nexus', alert)
-        except ImportError:
-            self._log_event(f"{SYMBOLS['SUSPICIOUS']} Failed to trigger self-healing")
+        heal = self._antibody_heal
+        if heal is None:
+            self._log_event("%s Failed to trigger self-healing", SYMBOLS['SUSPICIOUS'])
+            return
+        
+        self._log_event("%s Triggering self-healing for %s", SYMBOLS['HEAL'], alert['type'])
+        heal('nexus', alert)
     
-    def _log_event(self, message: str):
-        """Log an event
+    def _resolve_event_sinks(self) -> Tuple:
+        """Resolve the configured Sentinel/Manus event forwarders
         
-        Args:
-            message: Event message
+        Returns:
+            Tuple of log_event callables (empty if none are available)
         """
-        # Log locally
-        logger.info(message)
+        if self._event_sinks is not None:
+            return self._event_sinks
+        
+        config = getattr(self, 'config', None)
+        if config is None:
+            return ()  # Still loading config; resolve on a later event
+        
+        sinks = []
         
         # Log to Sentinel if configured
-        if self.config.get("log_to_sentinel", True):
+        if config.get("log_to_sentinel", True):
             try:
                 from vael_core.sentinel import log_event
-                log_event('nexus', message)
+                sinks.append(log_event)
             except ImportError:
                 pass  # Silent fail for token efficiency
         
         # Log to Manus if configured
-        if self.config.get("log_to_manus", True):
+        if config.get("log_to_manus", True):
             try:
                 from vael_core.manus_interface import log_event
-                log_event('nexus', message)
+                sinks.append(log_event)
             except ImportError:
                 pass  # Silent fail for token efficiency
+        
+        self._event_sinks = tuple(sinks)
+        return self._event_sinks
+    
+    def _log_event(self, message: str, *args):
+        """Log an event
+        
+        Args:
+            message: Event message, optionally a %-style format string
+            *args: Values for the format string
+        """
+        sinks = self._resolve_event_sinks()
+        
+        # Nobody consumes the event; don't build the message at all
+        if not sinks and not logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Log locally; formatting is deferred to the logger
+        logger.info(message, *args)
+        
+        if sinks:
+            text = message % args if args else message
+            for log_event in sinks:
+                log_event('nexus', text)
+
+# Singleton instance, created on first use so importing the package (or its
+# submodules, for SYMBOLS) doesn't run config loading and self-validation
+_nexus = None
+_nexus_lock = threading.Lock()
+
+def _get_nexus() -> NEXUS:
+    """Get the NEXUS singleton, creating it on first use
+    
+    Returns:
+        The shared NEXUS instance
+    """
+    global _nexus
+    if _nexus is None:
+        with _nexus_lock:
+            if _nexus is None:
+                _nexus = NEXUS()
+    return _nexus
 
-# Create singleton instance
-nexus = NEXUS()
+def __getattr__(name: str):
+    """Resolve `nexus` lazily for callers that use the attribute"""
+    if name == 'nexus':
+        return _get_nexus()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Export public interface
 def initialize(config_path: str = None) -> bool:
@@ -327,9 +455,11 @@ def initialize(config_path: str = None) -> bool:
     Returns:
         True if initialization successful, False otherwise
     """
-    global nexus
-    nexus = NEXUS(config_path)
-    return nexus.initialized
+    global _nexus
+    instance = NEXUS(config_path)
+    with _nexus_lock:
+        _nexus = instance
+    return instance.initialized
 
 def scan(target: Any = None) -> Dict:
     """Scan for anomalies and threats
@@ -340,7 +470,7 @@ def scan(target: Any = None) -> Dict:
     Returns:
         Scan results with threat assessment
     """
-    return nexus.scan(target)
+    return _get_nexus().scan(target)
 
 def set_high_alert(enabled: bool = True):
     """Set high alert mode
@@ -348,16 +478,16 @@ def set_high_alert(enabled: bool = True):
     Args:
         enabled: Whether to enable high alert mode
     """
-    nexus.set_high_alert(enabled)
+    _get_nexus().set_high_alert(enabled)
 
-def get_memory() -> List:
+def get_memory() -> Tuple:
     """Get contents of memory buffer
     
     Returns:
-        List of memory entries
+        Read-only snapshot of memory entries
     """
-    return nexus.get_memory()
+    return _get_nexus().get_memory()
 
 def clear_memory():
     """Clear memory buffer"""
-    nexus.clear_memory()
+    _get_nexus().clear_memory()
@@ -12,9 +12,13 @@ import os
 import time
 import json
 import logging
+import atexit
 import hashlib
+from types import MappingProxyType
+from bisect import bisect_left
 from typing import Dict, List, Any, Optional, Tuple
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Import symbols from parent module
 from vael_core.nexus import SYMBOLS, THREAT_LEVELS
@@ -22,16 +26,49 @@ from vael_core.nexus import SYMBOLS, THREAT_LEVELS
 # Configure logging
 logger = logging.getLogger("vael.nexus.pulse")
 
+# Anomaly severities; anomalies carry the index as "severity_code"
+SEVERITY_LOW, SEVERITY_MEDIUM, SEVERITY_HIGH, SEVERITY_CRITICAL = range(4)
+_SEVERITY_NAMES = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# Z-score cut-offs (95%, 99.7%, 99.99% confidence); a score must exceed the
+# first to be anomalous and each further one raises the severity a step
+_Z_THRESHOLDS = (2, 3, 4)
+
+# Symbol for each threat level (0-5): clear, suspicious from LOW, breach from HIGH
+_THREAT_SYMBOL_TABLE = (
+    SYMBOLS["CLEAR"], SYMBOLS["CLEAR"],
+    SYMBOLS["SUSPICIOUS"], SYMBOLS["SUSPICIOUS"],
+    SYMBOLS["BREACH"], SYMBOLS["BREACH"]
+)
+_SYMBOLIC_PREFIXES = tuple(f"{symbol} NEXUS/PULSE/" for symbol in _THREAT_SYMBOL_TABLE)
+
+# Shared, read-only answer for throttled checks
+_RATE_LIMITED = MappingProxyType({
+    "status": "RATE_LIMITED",
+    "symbol": SYMBOLS["BLOCK"],
+    "message": "Pulse check rate limited"
+})
+
 class Pulse:
     """NEXUS Pulse anomaly detection system"""
     
     def __init__(self):
         """Initialize the Pulse system"""
-        self.last_pulse_time = 0
+        self.last_pulse_time = 0  # time.monotonic() of the last accepted check
         self.baseline = {}
-        self.anomalies = deque(maxlen=10)  # Last 10 anomalies for token efficiency
+        # Last 10 anomalous pulses for token efficiency, kept as compact
+        # (timestamp, threat_level, anomalies) records; dicts are only built
+        # for get_anomaly_history()
+        self.anomalies = deque(maxlen=10)
+        self._history_snapshot = None  # Cached get_anomaly_history() result; None when stale
         self.scan_count = 0
         self.signature_cache = {}
+        # Shared pool for the socket/log/network probes; its worker threads
+        # only start on the first submit
+        self._probe_executor = ThreadPoolExecutor(
+            max_workers=3,
+            thread_name_prefix="nexus-pulse-probe"
+        )
         self._load_baseline()
     
     def _load_baseline(self):
@@ -51,21 +88,28 @@ class Pulse:
                 "error_rate": {"mean": 0.5, "std": 0.5},
                 "session_duration": {"mean": 300.0, "std": 150.0}
             }
-            return
-        
-        try:
-            with open(baseline_path, 'r') as f:
-                self.baseline = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load baseline: {str(e)}")
-            # Use default baseline on error
-            self.baseline = {
-                "cpu_usage": {"mean": 30.0, "std": 15.0},
-                "memory_usage": {"mean": 40.0, "std": 20.0},
-                "request_rate": {"mean": 5.0, "std": 3.0},
-                "error_rate": {"mean": 0.5, "std": 0.5},
-                "session_duration": {"mean": 300.0, "std": 150.0}
-            }
+        else:
+            try:
+                with open(baseline_path, 'r') as f:
+                    self.baseline = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to load baseline: {str(e)}")
+                # Use default baseline on error
+                self.baseline = {
+                    "cpu_usage": {"mean": 30.0, "std": 15.0},
+                    "memory_usage": {"mean": 40.0, "std": 20.0},
+                    "request_rate": {"mean": 5.0, "std": 3.0},
+                    "error_rate": {"mean": 0.5, "std": 0.5},
+                    "session_duration": {"mean": 300.0, "std": 150.0}
+                }
+        
+        # Flatten the profiles once so each pulse reads plain tuples; metrics
+        # without spread can't be scored (division by zero) and are skipped
+        self._baseline_stats = tuple(
+            (metric, profile["mean"], profile["std"])
+            for metric, profile in self.baseline.items()
+            if profile.get("std", 0) > 0
+        )
     
     def check(self, context: Dict = None, high_alert: bool = False) -> Dict:
         """Perform a pulse check for anomalies
@@ -77,18 +121,15 @@ class Pulse:
         Returns:
             Pulse check results with anomaly assessment
         """
-        current_time = time.time()
+        now = time.monotonic()
         min_interval = 0.2 if high_alert else 1.0
         
-        # Rate limiting
-        if current_time - self.last_pulse_time < min_interval:
-            return {
-                "status": "RATE_LIMITED",
-                "symbol": SYMBOLS["BLOCK"],
-                "message": "Pulse check rate limited"
-            }
+        # Rate limiting on the monotonic clock so wall-clock jumps can't skew it
+        if now - self.last_pulse_time < min_interval:
+            return _RATE_LIMITED
         
-        self.last_pulse_time = current_time
+        self.last_pulse_time = now
+        current_time = time.time()
         self.scan_count += 1
         
         # Gather system metrics if context not provided
@@ -101,23 +142,21 @@ class Pulse:
         threat_level = self._calculate_threat_level(anomalies)
         
         # Prepare result with symbolic compression
+        symbol = self._get_threat_symbol(threat_level)
         result = {
             "timestamp": current_time,
             "scan_id": f"PULSE-{self.scan_count}",
             "threat_level": threat_level,
             "threat_name": THREAT_LEVELS[threat_level],
             "anomalies": anomalies,
-            "symbol": self._get_threat_symbol(threat_level),
-            "symbolic": f"{self._get_threat_symbol(threat_level)} NEXUS/PULSE/{current_time:.0f}"
+            "symbol": symbol,
+            "symbolic": _SYMBOLIC_PREFIXES[threat_level] + format(current_time, ".0f")
         }
         
         # Store anomalies if any found
         if anomalies and threat_level > 0:
-            self.anomalies.append({
-                "timestamp": current_time,
-                "threat_level": threat_level,
-                "anomalies": anomalies
-            })
+            self.anomalies.append((current_time, threat_level, anomalies))
+            self._history_snapshot = None
         
         return result
     
@@ -134,31 +173,14 @@ class Pulse:
         # Simulate normal metrics with occasional anomalies
         anomaly_chance = 0.05  # 5% chance of anomaly
         
+        # Sample every baseline metric around its profile; gauss() draws
+        # Box-Muller pairs instead of normalvariate()'s rejection loop
+        gauss = random.gauss
         metrics = {
-            "cpu_usage": random.normalvariate(
-                self.baseline["cpu_usage"]["mean"],
-                self.baseline["cpu_usage"]["std"]
-            ),
-            "memory_usage": random.normalvariate(
-                self.baseline["memory_usage"]["mean"],
-                self.baseline["memory_usage"]["std"]
-            ),
-            "request_rate": random.normalvariate(
-                self.baseline["request_rate"]["mean"],
-                self.baseline["request_rate"]["std"]
-            ),
-            "error_rate": random.normalvariate(
-                self.baseline["error_rate"]["mean"],
-                self.baseline["error_rate"]["std"]
-            ),
-            "session_duration": random.normalvariate(
-                self.baseline["session_duration"]["mean"],
-                self.baseline["session_duration"]["std"]
-            ),
-            "socket_payloads": self._check_socket_payloads(),
-            "log_entries": self._check_log_entries(),
-            "network_traffic": self._check_network_traffic()
+            metric: gauss(profile["mean"], profile["std"])
+            for metric, profile in self.baseline.items()
         }
+        metrics.update(self._run_probes())
         
         # Introduce anomaly if random chance hits
         if random.random() < anomaly_chance:
@@ -171,6 +193,24 @@ class Pulse:
         
         return metrics
     
+    def _run_probes(self) -> Dict:
+        """Run the socket, log and network probes concurrently
+        
+        The probes are independent and I/O-bound once they do real work, so
+        the gather phase waits for the slowest probe rather than all three.
+        
+        Returns:
+            Probe results keyed by metric name
+        """
+        probes = (
+            ("socket_payloads", self._check_socket_payloads),
+            ("log_entries", self._check_log_entries),
+            ("network_traffic", self._check_network_traffic)
+        )
+        
+        futures = [(metric, self._probe_executor.submit(probe)) for metric, probe in probes]
+        return {metric: future.result() for metric, future in futures}
+    
     def _check_socket_payloads(self) -> Dict:
         """Check socket payloads for anomalies
         
@@ -224,27 +264,24 @@ class Pulse:
         anomalies = []
         
         # Check each baseline metric
-        for metric, baseline in self.baseline.items():
+        for metric, mean, std in self._baseline_stats:
             if metric in metrics:
                 # Calculate z-score (how many standard deviations from mean)
-                if baseline["std"] > 0:  # Avoid division by zero
-                    z_score = abs(metrics[metric] - baseline["mean"]) / baseline["std"]
-                    
-                    # Z-score > 2 is potentially anomalous (95% confidence)
-                    if z_score > 2:
-                        severity = "LOW"
-                        if z_score > 3:  # 99.7% confidence
-                            severity = "MEDIUM"
-                        if z_score > 4:  # 99.99% confidence
-                            severity = "HIGH"
-                        
-                        anomalies.append({
-                            "metric": metric,
-                            "value": metrics[metric],
-                            "baseline": baseline["mean"],
-                            "z_score": z_score,
-                            "severity": severity
-                        })
+                value = metrics[metric]
+                z_score = abs(value - mean) / std
+                
+                # Z-score > 2 is potentially anomalous
+                exceeded = bisect_left(_Z_THRESHOLDS, z_score)
+                if exceeded:
+                    code = exceeded - 1
+                    anomalies.append({
+                        "metric": metric,
+                        "value": value,
+                        "baseline": mean,
+                        "z_score": z_score,
+                        "severity": _SEVERITY_NAMES[code],
+                        "severity_code": code
+                    })
         
         # Check socket payloads
         if metrics.get("socket_payloads", {}).get("anomalous", 0) > 0:
@@ -253,19 +290,22 @@ class Pulse:
                 "anomalous": metrics["socket_payloads"]["anomalous"],
                 "total": metrics["socket_payloads"]["total"],
                 "patterns": metrics["socket_payloads"]["patterns"],
-                "severity": "MEDIUM"
+                "severity": "MEDIUM",
+                "severity_code": SEVERITY_MEDIUM
             })
         
         # Check log entries
         log_entries = metrics.get("log_entries", {})
         error_ratio = log_entries.get("error_count", 0) / max(log_entries.get("total", 1), 1)
         if error_ratio > 0.05:  # More than 5% errors
+            code = SEVERITY_MEDIUM if error_ratio < 0.1 else SEVERITY_HIGH
             anomalies.append({
                 "metric": "log_errors",
                 "error_count": log_entries.get("error_count", 0),
                 "total": log_entries.get("total", 0),
                 "ratio": error_ratio,
-                "severity": "MEDIUM" if error_ratio < 0.1 else "HIGH"
+                "severity": _SEVERITY_NAMES[code],
+                "severity_code": code
             })
         
         return anomalies
@@ -283,27 +323,21 @@ class Pulse:
             return 0  # No threat
         
         # Count anomalies by severity
-        severity_counts = {
-            "LOW": 0,
-            "MEDIUM": 0,
-            "HIGH": 0,
-            "CRITICAL": 0
-        }
-        
+        counts = [0, 0, 0, 0]
         for anomaly in anomalies:
-            severity = anomaly.get("severity", "LOW")
-            severity_counts[severity] += 1
+            counts[anomaly.get("severity_code", SEVERITY_LOW)] += 1
+        low, medium, high, critical = counts
         
         # Determine threat level
-        if severity_counts["CRITICAL"] > 0:
+        if critical:
             return 5  # Critical threat
-        if severity_counts["HIGH"] > 2:
+        if high > 2:
             return 4  # High threat
-        if severity_counts["HIGH"] > 0 or severity_counts["MEDIUM"] > 2:
+        if high or medium > 2:
             return 3  # Medium threat
-        if severity_counts["MEDIUM"] > 0 or severity_counts["LOW"] > 3:
+        if medium or low > 3:
             return 2  # Low threat
-        if severity_counts["LOW"] > 0:
+        if low:
             return 1  # Info level threat
         
         return 0  # No threat
@@ -317,22 +351,31 @@ class Pulse:
         Returns:
             Symbol representing threat level
         """
-        if threat_level >= 4:  # High or Critical
-            return SYMBOLS["BREACH"]
-        if threat_level >= 2:  # Medium or Low
-            return SYMBOLS["SUSPICIOUS"]
-        return SYMBOLS["CLEAR"]
+        return _THREAT_SYMBOL_TABLE[threat_level]
     
-    def get_anomaly_history(self) -> List[Dict]:
+    def close(self):
+        """Shut down the probe pool
+        
+        Pending probes are cancelled; checks can't gather metrics afterwards.
+        """
+        self._probe_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_anomaly_history(self) -> Tuple[Dict, ...]:
         """Get history of detected anomalies
         
         Returns:
-            List of historical anomalies
+            Read-only snapshot of historical anomalies, shared until a new one is stored
         """
-        return list(self.anomalies)
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(
+                {"timestamp": timestamp, "threat_level": level, "anomalies": found}
+                for timestamp, level, found in self.anomalies
+            )
+        return self._history_snapshot
 
 # Create singleton instance
 pulse_system = Pulse()
+atexit.register(pulse_system.close)
 
 # Public interface
 def check(context: Dict = None, high_alert: bool = False) -> Dict:
@@ -347,10 +390,10 @@ def check(context: Dict = None, high_alert: bool = False) -> Dict:
     """
     return pulse_system.check(context, high_alert)
 
-def get_anomaly_history() -> List[Dict]:
+def get_anomaly_history() -> Tuple[Dict, ...]:
     """Get history of detected anomalies
     
     Returns:
-        List of historical anomalies
+        Read-only snapshot of historical anomalies
     """
     return pulse_system.get_anomaly_history()
@@ -433,7 +433,8 @@ class Suggest:
         confidence = threat.get("confidence", 0.5)
         
         # Generic countermeasures based on metric type
-        if "cpu" in metric.lower():
+        metric_lower = metric.lower()
+        if "cpu" in metric_lower:
             return [{
                 "action": "MONITOR",
                 "description": "Monitor CPU usage and identify resource-intensive processes",
@@ -448,7 +449,7 @@ class Suggest:
                 "confidence": confidence * 0.8  # Lower confidence for generic measure
             }]
         
-        elif "memory" in metric.lower():
+        elif "memory" in metric_lower:
             return [{
                 "action": "MONITOR",
                 "description": "Monitor memory usage and check for memory leaks",
@@ -463,7 +464,7 @@ class Suggest:
                 "confidence": confidence * 0.8
             }]
         
-        elif "error" in metric.lower() or "log" in metric.lower():
+        elif "error" in metric_lower or "log" in metric_lower:
             return [{
                 "action": "ANALYZE",
                 "description": "Analyze error logs to identify root cause",
@@ -478,7 +479,7 @@ class Suggest:
                 "confidence": confidence * 0.7
             }]
         
-        elif "network" in metric.lower() or "traffic" in metric.lower():
+        elif "network" in metric_lower or "traffic" in metric_lower:
             return [{
                 "action": "MONITOR",
                 "description": "Monitor network traffic for unusual patterns",
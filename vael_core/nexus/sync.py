@@ -23,6 +23,32 @@ from vael_core.nexus import SYMBOLS
 # Configure logging
 logger = logging.getLogger("vael.nexus.sync")
 
+def _read_bytes(path: str) -> bytes:
+    """Read a rule file as raw bytes
+    
+    Args:
+        path: Path to rule file
+        
+    Returns:
+        File contents
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _digest(raw: bytes) -> str:
+    """Hash rule file contents for change detection and integrity checks
+    
+    Hashing the bytes as stored lets an unchanged file be recognized
+    without parsing and re-serializing it.
+    
+    Args:
+        raw: File contents
+        
+    Returns:
+        Hex digest
+    """
+    return hashlib.blake2b(raw, digest_size=32).hexdigest()
+
 class Sync:
     """NEXUS Sync rule management system"""
     
@@ -79,25 +105,24 @@ class Sync:
             self._create_default_rules(rule_type, path)
         
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-                
-                # Validate structure
-                if not isinstance(data, dict) or 'version' not in data or 'rules' not in data:
-                    logger.warning(f"{SYMBOLS['SUSPICIOUS']} Invalid rule format in {path}")
-                    self._create_default_rules(rule_type, path)
-                    with open(path, 'r') as f:
-                        data = json.load(f)
-                
-                # Store rules and version
-                self.rules[rule_type] = data['rules']
-                self.rule_versions[rule_type] = data['version']
-                
-                # Compute and store hash for integrity checking
-                rule_hash = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
-                self.rule_hashes[rule_type] = rule_hash
-                
-                logger.info(f"{SYMBOLS['RULE']} Loaded {len(data['rules'])} {rule_type} rules (v{data['version']})")
+            raw = _read_bytes(path)
+            data = json.loads(raw)
+            
+            # Validate structure
+            if not isinstance(data, dict) or 'version' not in data or 'rules' not in data:
+                logger.warning(f"{SYMBOLS['SUSPICIOUS']} Invalid rule format in {path}")
+                self._create_default_rules(rule_type, path)
+                raw = _read_bytes(path)
+                data = json.loads(raw)
+            
+            # Store rules and version
+            self.rules[rule_type] = data['rules']
+            self.rule_versions[rule_type] = data['version']
+            
+            # Compute and store hash for integrity checking
+            self.rule_hashes[rule_type] = _digest(raw)
+            
+            logger.info(f"{SYMBOLS['RULE']} Loaded {len(data['rules'])} {rule_type} rules (v{data['version']})")
         
         except Exception as e:
             logger.error(f"{SYMBOLS['SUSPICIOUS']} Failed to load {rule_type} rules: {str(e)}")
@@ -299,18 +324,16 @@ class Sync:
         for rule_type, path in self.rule_paths.items():
             if os.path.exists(path):
                 try:
-                    # Read current file
-                    with open(path, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Compute hash
-                    current_hash = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+                    # Read current file; only a changed file is parsed
+                    raw = _read_bytes(path)
+                    current_hash = _digest(raw)
                     
                     # Compare with stored hash
                     if rule_type in self.rule_hashes and current_hash != self.rule_hashes[rule_type]:
                         logger.info(f"{SYMBOLS['RULE']} External update detected for {rule_type} rules")
                         
                         # Reload rules
+                        data = json.loads(raw)
                         self.rules[rule_type] = data['rules']
                         self.rule_versions[rule_type] = data['version']
                         self.rule_hashes[rule_type] = current_hash
@@ -349,13 +372,12 @@ class Sync:
                         shutil.copy2(path, backup_path)
                     
                     # Save updated rules
-                    with open(path, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    raw = json.dumps(data, indent=2).encode()
+                    with open(path, 'wb') as f:
+                        f.write(raw)
                     
                     # Update hash
-                    self.rule_hashes[rule_type] = hashlib.sha256(
-                        json.dumps(data, sort_keys=True).encode()
-                    ).hexdigest()
+                    self.rule_hashes[rule_type] = _digest(raw)
                     
                     logger.info(f"{SYMBOLS['RULE']} Updated {rule_type} rules (v{self.rule_versions[rule_type]})")
                 
@@ -529,12 +551,8 @@ class Sync:
         for rule_type, path in self.rule_paths.items():
             if os.path.exists(path):
                 try:
-                    # Read current file
-                    with open(path, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Compute hash
-                    current_hash = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+                    # Hash the file as stored
+                    current_hash = _digest(_read_bytes(path))
                     
                     # Compare with stored hash
                     if rule_type in self.rule_hashes:
@@ -563,8 +581,26 @@ class Sync:
         
         return results
 
-# Create singleton instance
-sync_system = Sync()
+# Singleton instance, created on first use; constructing it reads (and
+# creates) every rule file, which importing this module shouldn't do
+_sync_system = None
+
+def _get_sync_system() -> Sync:
+    """Get the Sync singleton, creating it on first use
+    
+    Returns:
+        The shared Sync instance
+    """
+    global _sync_system
+    if _sync_system is None:
+        _sync_system = Sync()
+    return _sync_system
+
+def __getattr__(name: str):
+    """Resolve `sync_system` lazily for callers that use the attribute"""
+    if name == 'sync_system':
+        return _get_sync_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Public interface
 def sync(force: bool = False) -> Dict:
@@ -576,7 +612,7 @@ def sync(force: bool = False) -> Dict:
     Returns:
         Synchronization results
     """
-    return sync_system.sync(force)
+    return _get_sync_system().sync(force)
 
 def get_rules(rule_type: str) -> List[Dict]:
     """Get rules of a specific type
@@ -587,7 +623,7 @@ def get_rules(rule_type: str) -> List[Dict]:
     Returns:
         List of rules
     """
-    return sync_system.get_rules(rule_type)
+    return _get_sync_system().get_rules(rule_type)
 
 def get_rule_version(rule_type: str) -> str:
     """Get version of a rule set
@@ -598,7 +634,7 @@ def get_rule_version(rule_type: str) -> str:
     Returns:
         Version string
     """
-    return sync_system.get_rule_version(rule_type)
+    return _get_sync_system().get_rule_version(rule_type)
 
 def add_rule(rule_type: str, rule: Dict) -> bool:
     """Add a new rule
@@ -610,7 +646,7 @@ def add_rule(rule_type: str, rule: Dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return sync_system.add_rule(rule_type, rule)
+    return _get_sync_system().add_rule(rule_type, rule)
 
 def update_rule(rule_type: str, rule_id: str, updates: Dict) -> bool:
     """Update an existing rule
@@ -623,7 +659,7 @@ def update_rule(rule_type: str, rule_id: str, updates: Dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return sync_system.update_rule(rule_type, rule_id, updates)
+    return _get_sync_system().update_rule(rule_type, rule_id, updates)
 
 def delete_rule(rule_type: str, rule_id: str) -> bool:
     """Delete a rule
@@ -635,7 +671,7 @@ def delete_rule(rule_type: str, rule_id: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return sync_system.delete_rule(rule_type, rule_id)
+    return _get_sync_system().delete_rule(rule_type, rule_id)
 
 def update_baseline(baseline_id: str, metrics: Dict) -> bool:
     """Update a baseline profile
@@ -647,7 +683,7 @@ def update_baseline(baseline_id: str, metrics: Dict) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return sync_system.update_baseline(baseline_id, metrics)
+    return _get_sync_system().update_baseline(baseline_id, metrics)
 
 def verify_integrity() -> Dict:
     """Verify integrity of all rule files
@@ -655,4 +691,4 @@ def verify_integrity() -> Dict:
     Returns:
         Integrity verification results
     """
-    return sync_system.verify_integrity()
+    return _get_sync_system().verify_integrity()
@@ -11,6 +11,7 @@ proactive guidance based on system state and detected anomalies.
 """
 
 import os
+import re
 import time
 import json
 import logging
@@ -51,6 +52,84 @@ PRIORITY_LEVELS = {
     'CRITICAL': '‼️',
 }
 
+# Recommended action per finding keyword, in precedence order per type;
+# the action paired with None applies when no keyword matches
+_FINDING_ACTIONS = {
+    'SECURITY': (
+        (('failed login',), "Implement account lockout policy and review authentication logs"),
+        (('unauthorized access',), "Isolate affected systems and initiate security incident response"),
+        (('suspicious activity',), "Increase monitoring and review recent system changes"),
+        (('network', 'port scan'), "Review firewall rules and network traffic patterns"),
+        (('file', 'permission'), "Verify file integrity and review recent changes"),
+        (None, "Investigate security concern and review logs"),
+    ),
+    'HEALTH': (
+        (('cpu usage',), "Identify CPU-intensive processes and optimize or restart if necessary"),
+        (('memory usage',), "Check for memory leaks and consider increasing available memory"),
+        (('disk usage',), "Clean up temporary files and logs, consider adding storage"),
+        (('crashed',), "Restart crashed processes and investigate root cause"),
+        (('log error',), "Review error logs and address recurring issues"),
+        (None, "Monitor system health and investigate anomalies"),
+    ),
+    'PERFORMANCE': (
+        (('response time', 'latency'), "Optimize request handling and consider scaling resources"),
+        (('throughput',), "Investigate bottlenecks and optimize data processing"),
+        (('query', 'database'), "Optimize database queries and review indexing strategy"),
+        (None, "Review performance metrics and optimize resource usage"),
+    ),
+}
+
+def _minimize_keywords(rank):
+    """Drop keywords that can never decide a match.
+    
+    A keyword is redundant when a shorter one of the same or higher
+    precedence is a substring of it: any finding containing the longer
+    keyword already matches the shorter one at an equal or better rank.
+    """
+    kept = {}
+    for keyword in sorted(rank, key=len):
+        if not any(other in keyword and row <= rank[keyword] for other, row in kept.items()):
+            kept[keyword] = rank[keyword]
+    return kept
+
+def _compile_keyword_matcher(table):
+    """Compile one type's keyword table into a single scanner.
+    
+    The lookahead reports a keyword at every position. At a shared start
+    position only the first alternative is reported, so alternatives are
+    ordered by precedence (longest first within a row) and each keyword maps
+    back to its table row; one pass over a finding replaces a substring test
+    per keyword.
+    
+    A shorter keyword of a later row must not hide a longer, earlier one:
+    
+    >>> pattern, rank = _compile_keyword_matcher(
+    ...     ((('port scan',), 'A'), (('port',), 'B'), (None, 'C')))
+    >>> min(rank[m.group(1)] for m in pattern.finditer('port scan detected'))
+    0
+    """
+    rank = {}
+    for row, (keywords, _) in enumerate(table):
+        for keyword in keywords or ():
+            rank.setdefault(keyword, row)
+    rank = _minimize_keywords(rank)
+    ordered = sorted(rank, key=lambda keyword: (rank[keyword], -len(keyword)))
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+    return pattern, rank
+
+def _build_finding_matchers():
+    """Compile a scanner for every recommendation type."""
+    return {rec_type: _compile_keyword_matcher(table) for rec_type, table in _FINDING_ACTIONS.items()}
+
+_FINDING_MATCHERS = _build_finding_matchers()
+
+def _match_finding_action(rec_type: str, finding: str) -> str:
+    """Pick the recommended action for a finding."""
+    table = _FINDING_ACTIONS[rec_type]
+    pattern, rank = _FINDING_MATCHERS[rec_type]
+    row = min((rank[m.group(1)] for m in pattern.finditer(finding.lower())), default=len(table) - 1)
+    return table[row][1]
+
 # Module state
 _recommendation_history = []
 _max_history = 50
@@ -356,146 +435,19 @@ def _generate_recommendations(analysis_results: List[Dict[str, Any]]) -> List[Di
         priority = result['priority']
         findings = result['findings']
         
-        if not findings:
+        if not findings or rec_type not in _FINDING_ACTIONS:
             continue
         
         # Generate type-specific recommendations
-        if rec_type == 'SECURITY':
-            for finding in findings:
-                if 'failed login' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Implement account lockout policy and review authentication logs",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'unauthorized access' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Isolate affected systems and initiate security incident response",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'suspicious activity' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Increase monitoring and review recent system changes",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'network' in finding.lower() or 'port scan' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Review firewall rules and network traffic patterns",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'file' in finding.lower() or 'permission' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Verify file integrity and review recent changes",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                else:
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Investigate security concern and review logs",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-        
-        elif rec_type == 'HEALTH':
-            for finding in findings:
-                if 'cpu usage' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Identify CPU-intensive processes and optimize or restart if necessary",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'memory usage' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Check for memory leaks and consider increasing available memory",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'disk usage' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Clean up temporary files and logs, consider adding storage",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'crashed' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Restart crashed processes and investigate root cause",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'log error' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Review error logs and address recurring issues",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                else:
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Monitor system health and investigate anomalies",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-        
-        elif rec_type == 'PERFORMANCE':
-            for finding in findings:
-                if 'response time' in finding.lower() or 'latency' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Optimize request handling and consider scaling resources",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'throughput' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Investigate bottlenecks and optimize data processing",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                elif 'query' in finding.lower() or 'database' in finding.lower():
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Optimize database queries and review indexing strategy",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
-                else:
-                    recommendations.append({
-                        'type': rec_type,
-                        'priority': priority,
-                        'finding': finding,
-                        'action': "Review performance metrics and optimize resource usage",
-                        'symbol': f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
-                    })
+        symbol = f"{RECOMMENDATION_TYPES[rec_type]} {PRIORITY_LEVELS[priority]}"
+        for finding in findings:
+            recommendations.append({
+                'type': rec_type,
+                'priority': priority,
+                'finding': finding,
+                'action': _match_finding_action(rec_type, finding),
+                'symbol': symbol
+            })
     
     return recommendations
 
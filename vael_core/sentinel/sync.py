@@ -15,6 +15,7 @@ import json
 import time
 import logging
 import shutil
+import importlib
 from datetime import datetime
 from pathlib import Path
 
@@ -70,6 +71,14 @@ _config = {}
 _config_path = None
 _last_sync = 0
 _sync_count = 0
+_sentinel_module = None
+
+def _get_sentinel_module():
+    """Import the sentinel module on first use and reuse it for later syncs."""
+    global _sentinel_module
+    if _sentinel_module is None:
+        _sentinel_module = importlib.import_module('sentinel')
+    return _sentinel_module
 
 def _get_config_path():
     """Get the path to the configuration file."""
@@ -210,9 +219,8 @@ def sync(force=False):
     # Load configuration
     try:
         # Remember essential data
-        alert_history = None
-        if hasattr(__import__('sentinel', fromlist=['_alert_history']), '_alert_history'):
-            alert_history = __import__('sentinel', fromlist=['_alert_history'])._alert_history
+        sentinel = _get_sentinel_module()
+        alert_history = getattr(sentinel, '_alert_history', None)
         
         # Load and validate configuration
         new_config = _load_config()
@@ -224,7 +232,6 @@ def sync(force=False):
         _sync_count += 1
         
         # Update sentinel module configuration
-        sentinel = __import__('sentinel', fromlist=['_alert_history', '_max_history'])
         if hasattr(sentinel, '_max_history'):
             sentinel._max_history = _config.get('alert_history_size', DEFAULT_CONFIG['alert_history_size'])
         
@@ -232,24 +232,42 @@ class EntityRegistry:
 registry = EntityRegistry()
 
 
-def start_heartbeat(interval: int = 5) -> threading.Thread:
-    """Start a heartbeat thread that pulses all active entities.
+def start_heartbeat(interval: int = 5) -> Any:
+    """Start a heartbeat task that pulses all active entities.
+    
+    When the registry has a SocketIO instance the heartbeat runs as a SocketIO
+    background task, so it cooperates with eventlet/gevent workers; otherwise
+    it runs in a daemon thread. Beats follow monotonic deadlines, so time spent
+    in pulse_all() doesn't accumulate as drift.
     
     Args:
         interval: Seconds between pulses
         
     Returns:
-        The started thread
+        The started thread or background task
     """
+    socketio = registry.socketio
+    sleep = socketio.sleep if socketio is not None else time.sleep
+    
     def _beat():
+        next_beat = time.monotonic()
         while True:
             registry.pulse_all()
-            time.sleep(interval)
+            next_beat += interval
+            delay = next_beat - time.monotonic()
+            if delay < 0:
+                # Fell behind; skip the missed beats rather than bursting
+                next_beat = time.monotonic()
+                delay = 0
+            sleep(delay)
     
-    thread = threading.Thread(target=_beat, daemon=True, name="VAEL-heartbeat")
-    thread.start()
+    if socketio is not None:
+        task = socketio.start_background_task(_beat)
+    else:
+        task = threading.Thread(target=_beat, daemon=True, name="VAEL-heartbeat")
+        task.start()
     logger.info(f"Heartbeat started with interval {interval}s")
-    return thread
+    return task
 
 
 def set_socketio(socketio) -> None:
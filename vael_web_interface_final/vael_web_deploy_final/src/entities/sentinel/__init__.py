@@ -12,12 +12,20 @@ This module provides:
 """
 
 import re
+import sys
 import time
 import logging
 import json
+import functools
+import itertools
 from typing import Dict, List, Any, Optional, Pattern, Callable, Union
 from enum import Enum, auto
 
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
 from .. import Entity, registry
 
 # Configure logger
@@ -32,8 +40,28 @@ class RuleAction(Enum):
     ALERT = auto()      # Alert operators but allow the message
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_rule_pattern(pattern: str) -> Pattern:
+    """Compile a rule pattern once per process, shared across Rule instances."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class Rule:
-    """Security rule for message inspection."""
+    """Security rule for message inspection.
+    
+    Attributes live in __slots__; subclasses must declare __slots__ for any
+    attributes they add.
+    """
+    
+    __slots__ = (
+        'name', 'description', 'action', 'pattern',
+        '_enabled', '_created_at', '_match_count'
+    )
+    
+    # Advanced whenever any rule is enabled or disabled, so a Sentinel can tell
+    # its compiled rule bundle is stale without walking its rules
+    _state_versions = itertools.count(1)
+    _state_version = 0
     
     def __init__(self, 
                  name: str, 
@@ -50,7 +78,9 @@ class Rule:
             description: Human-readable description of the rule
             enabled: Whether this rule is active
         """
-        self.name = name
+        # Names key the rule table and every action record; interned copies
+        # are shared and compare by identity
+        self.name = sys.intern(name)
         self.description = description
         self.action = action
         self.enabled = enabled
@@ -59,10 +89,20 @@ class Rule:
         
         # Compile pattern if it's a string
         if isinstance(pattern, str):
-            self.pattern = re.compile(pattern, re.IGNORECASE)
+            self.pattern = _compile_rule_pattern(pattern)
         else:
             self.pattern = pattern
     
+    @property
+    def enabled(self) -> bool:
+        """Whether this rule is active."""
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        Rule._state_version = next(Rule._state_versions)
+    
     def matches(self, text: str) -> bool:
         """Check if this rule matches the given text.
         
@@ -115,6 +155,159 @@ class Rule:
         return rule
 
 
+# Leading global inline flags such as "(?i)"; scoped per branch when fusing
+_GLOBAL_FLAGS_RE = re.compile(r'^\(\?[aiLmsux]+\)')
+_SCOPED_FLAGS = ((re.ASCII, 'a'), (re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+@functools.lru_cache(maxsize=64)
+def _fuse_patterns(patterns: tuple) -> Optional[Pattern]:
+    """Fuse compiled rule patterns into a single alternation.
+    
+    Pattern i is wrapped in the named group "_r<i>", so a match's lastgroup
+    tells which pattern produced it. The alternation sits in a lookahead, so
+    finditer reports a match at every position where any pattern matches.
+    Cached so Sentinels sharing a rule set share the fused pattern too.
+    
+    Fusing must not change what a rule matches, including on non-ASCII text:
+    
+    >>> _fuse_patterns((re.compile(r'(<)?q(?(1)>|y)'),)) is None
+    True
+    >>> patterns = (re.compile(r'(?a)\\w{3}é'), re.compile(r'(?i)k'))
+    >>> text = 'éééé \u212a'
+    >>> _match_patterns(patterns, text) == {i for i, p in enumerate(patterns) if p.search(text)}
+    True
+    
+    Args:
+        patterns: Tuple of compiled patterns
+        
+    Returns:
+        The fused pattern, or None if the patterns can't be combined safely
+    """
+    parts = []
+    for index, pattern in enumerate(patterns):
+        source = pattern.pattern
+        # Backreferences, conditionals and verbose patterns don't survive
+        # being spliced: group numbers shift onto other rules' groups
+        if (not isinstance(source, str) or pattern.flags & re.VERBOSE
+                or re.search(r'\\\d|\(\?P=|\(\?\(', source)):
+            return None
+        flags = ''.join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+        body = _GLOBAL_FLAGS_RE.sub('', source)
+        parts.append(f"(?P<_r{index}>(?{flags}:{body}))" if flags else f"(?P<_r{index}>{body})")
+    
+    if not parts:
+        return None
+    
+    try:
+        fused = re.compile('(?=' + '|'.join(parts) + ')')
+    except re.error as e:
+        # e.g. the same named group used by two rules
+        logger.debug(f"Could not fuse rule patterns: {e}")
+        return None
+    
+    # Dispatch reads lastgroup, so every wrapper must exist and enclose exactly
+    # its rule's own groups
+    if (fused.groups != len(patterns) + sum(p.groups for p in patterns)
+            or any(fused.groupindex.get(f"_r{i}") is None for i in range(len(patterns)))):
+        return None
+    return fused
+
+
+def _match_patterns(patterns: tuple, text: str) -> set:
+    """Find which patterns match the text, scanning it with fused patterns.
+    
+    At any one position only the first matching alternative is reported, so
+    patterns that weren't reported are fused and scanned again until a pass
+    reports nothing. Typically that is one pass for clean text and two for a
+    match, instead of one per pattern.
+    
+    Dispatch holds when rules carry their own groups, conditionals or inline
+    flags:
+    
+    >>> patterns = (re.compile(r'(a)(?P<tail>b+)'), re.compile(r'(<)?q(?(1)>|y)'),
+    ...             re.compile(r'(?i)(x)\\1'), re.compile(r'(?ai)\\bk\\w'), re.compile(r'(?s)c.d'))
+    >>> for text in ('abb <q> xX', 'qy \u212aé c\\nd', 'Kx ab', 'é'):
+    ...     assert _match_patterns(patterns, text) == {
+    ...         i for i, p in enumerate(patterns) if p.search(text)}, text
+    
+    Args:
+        patterns: Tuple of compiled patterns
+        text: The text to scan
+        
+    Returns:
+        Indices into patterns of those that match
+    """
+    matched = set()
+    remaining = tuple(range(len(patterns)))
+    while remaining:
+        fused = _fuse_patterns(tuple(patterns[i] for i in remaining))
+        if fused is None:
+            matched.update(i for i in remaining if patterns[i].search(text))
+            break
+        
+        hits = {int(m.lastgroup[2:]) for m in fused.finditer(text)}
+        if not hits:
+            break
+        matched.update(remaining[hit] for hit in hits)
+        remaining = tuple(i for pos, i in enumerate(remaining) if pos not in hits)
+    return matched
+
+
+@functools.lru_cache(maxsize=128)
+def _required_literals(pattern: Pattern) -> tuple:
+    """Get literal substrings that every match of a pattern contains.
+    
+    Only ASCII literal runs at the top level of the pattern count, so ASCII
+    text lacking any of them can't match. Case-insensitive patterns yield
+    lowercased literals, to be tested against lowercased text.
+    
+    Args:
+        pattern: Compiled pattern
+        
+    Returns:
+        Tuple of literals, empty if none could be extracted
+    """
+    source = pattern.pattern
+    if not isinstance(source, str):
+        return ()
+    try:
+        parsed = _sre_parse.parse(source, pattern.flags)
+    except Exception:
+        return ()
+    
+    literals = []
+    run = []
+    for op, arg in parsed:
+        if op is _sre_parse.LITERAL and arg < 128:
+            run.append(chr(arg))
+        elif run:
+            literals.append(''.join(run))
+            run = []
+    if run:
+        literals.append(''.join(run))
+    
+    if pattern.flags & re.IGNORECASE:
+        literals = [literal.lower() for literal in literals]
+    return tuple(dict.fromkeys(literals))
+
+
+@functools.lru_cache(maxsize=16)
+def _min_match_length(patterns: tuple) -> int:
+    """Get the length of the shortest text any of the patterns can match.
+    
+    Args:
+        patterns: Tuple of compiled patterns
+        
+    Returns:
+        The minimum match width, or 0 if it can't be determined
+    """
+    try:
+        return min((_sre_parse.parse(p.pattern, p.flags).getwidth()[0] for p in patterns), default=0)
+    except Exception:
+        return 0
+
+
 class Sentinel(Entity):
     """Security entity that inspects messages for threats.
     
@@ -134,6 +327,13 @@ class Sentinel(Entity):
         """
         super().__init__(name, socketio)
         self.rules: Dict[str, Rule] = {}
+        self._enabled_rules: tuple = ()
+        self._enabled_key: tuple = ()
+        self._rules_version = 0
+        self._free_rules: tuple = ()
+        self._free_patterns: tuple = ()
+        self._anchored_rules: tuple = ()
+        self._min_match_len = 0
         self._load_default_rules()
         self._threats_detected = 0
         self._messages_processed = 0
@@ -141,42 +341,53 @@ class Sentinel(Entity):
         logger.info(f"Sentinel {name} initialized with {len(self.rules)} default rules")
     
     def _load_default_rules(self) -> None:
-        """Load default security rules."""
+        """Load default security rules.
+        
+        Rule compiles string patterns case-insensitively, so the patterns carry
+        no inline flags beyond (?m). Alternations are prefix-factored and
+        capture-free; "sh" already covers bash and powershell after the ".*".
+        
+        Patterns avoid rescanning the text from every candidate start, which
+        made adversarial input (e.g. thousands of ";") quadratic. A line has a
+        separator followed by sh/cmd iff its first separator does, so
+        command_injection only tries each line's first separator. The tag
+        body is a character class instead of a lazy ".*?".
+        """
         default_rules = [
             Rule(
                 name="sql_injection",
-                pattern=r"(?i)(select|update|delete|insert|drop|alter)\s+(from|into|table)",
+                pattern=r"(?:d(?:elete|rop)|select|update|insert|alter)\s+(?:from|into|table)",
                 action=RuleAction.BLOCK,
                 description="Blocks SQL injection attempts"
             ),
             Rule(
                 name="xss_script",
-                pattern=r"(?i)<script.*?>",
+                pattern=r"<script[^>\n]*>",
                 action=RuleAction.SANITIZE,
                 description="Sanitizes XSS script tags"
             ),
             Rule(
                 name="command_injection",
-                pattern=r"(?i)(;|\||\$\(|\`).*(sh|bash|cmd|powershell)",
+                pattern=r"(?m)^(?:[^;|`$\n]|\$(?!\())*(?:[;|`]|\$\().*(?:sh|cmd)",
                 action=RuleAction.BLOCK,
                 description="Blocks command injection attempts"
             ),
             Rule(
                 name="path_traversal",
-                pattern=r"(?i)\.\.(/|\\)",
+                pattern=r"\.\.[/\\]",
                 action=RuleAction.BLOCK,
                 description="Blocks directory traversal attempts"
             ),
             Rule(
                 name="sensitive_data",
-                pattern=r"(?i)(password|api[-_]?key|secret|token)[\s:=]+\w+",
+                pattern=r"(?:password|api[-_]?key|secret|token)[\s:=]+\w+",
                 action=RuleAction.LOG,
                 description="Logs potential sensitive data exposure"
             ),
             # Symbolic trigger pattern - token efficient
             Rule(
                 name="symbolic_access",
-                pattern=r"\[\[VAEL::(ACCESS|CONTROL|ADMIN)\]\]",
+                pattern=r"\[\[VAEL::(?:ACCESS|CONTROL|ADMIN)\]\]",
                 action=RuleAction.ALERT,
                 description="Detects symbolic access control triggers"
             )
@@ -198,6 +409,7 @@ class Sentinel(Entity):
             logger.warning(f"Rule {rule.name} already exists, replacing")
         
         self.rules[rule.name] = rule
+        self._rules_version += 1
         logger.info(f"Added rule: {rule.name}")
         return True
     
@@ -212,6 +424,7 @@ class Sentinel(Entity):
         """
         if rule_name in self.rules:
             del self.rules[rule_name]
+            self._rules_version += 1
             logger.info(f"Removed rule: {rule_name}")
             return True
         
@@ -269,11 +482,80 @@ class Sentinel(Entity):
             return True
         return False
     
-    def scan_text(self, text: str) -> Dict[str, Any]:
+    def _get_enabled_rules(self) -> tuple:
+        """Get the enabled rules and their patterns, refreshing them if the rules changed.
+        
+        The bundle is keyed on this Sentinel's rule-set version (bumped by
+        add_rule/remove_rule/import_rules) and the global enable/disable
+        version, so a stable rule set costs one tuple compare per scan.
+        
+        Also refreshes the minimum match length used to skip short texts, and
+        splits the rules into those with required literals ("anchored"), which
+        are only searched when their literals occur, and the rest ("free"),
+        which are scanned together.
+        
+        Returns:
+            Tuple of (enabled rules, their compiled patterns)
+        """
+        key = (self._rules_version, Rule._state_version)
+        if key != self._enabled_key:
+            enabled = [(rule, rule.pattern) for rule in self.rules.values() if rule.enabled]
+            patterns = tuple(pattern for _, pattern in enabled)
+            free = []
+            anchored = []
+            for index, pattern in enumerate(patterns):
+                literals = _required_literals(pattern)
+                if literals:
+                    anchored.append((index, literals, bool(pattern.flags & re.IGNORECASE)))
+                else:
+                    free.append(index)
+            self._enabled_rules = (tuple(rule for rule, _ in enabled), patterns)
+            self._free_rules = tuple(free)
+            self._free_patterns = tuple(patterns[i] for i in free)
+            self._anchored_rules = tuple(anchored)
+            self._min_match_len = _min_match_length(patterns)
+            self._enabled_key = key
+        return self._enabled_rules
+    
+    def _match_rules(self, text: str) -> set:
+        """Find the enabled rules matching the text.
+        
+        Args:
+            text: The text to scan
+            
+        Returns:
+            Indices into the enabled rules of those that match
+        """
+        rules, patterns = self._get_enabled_rules()
+        
+        # Nothing can match text shorter than every rule's shortest match
+        if len(text) < self._min_match_len:
+            return set()
+        
+        # Literal tests are only exact for ASCII text; IGNORECASE also
+        # matches a few non-ASCII letters (e.g. KELVIN SIGN for "k")
+        if not text.isascii():
+            return _match_patterns(patterns, text)
+        
+        free = self._free_rules
+        matched = {free[i] for i in _match_patterns(self._free_patterns, text)}
+        
+        # A cheap substring test rules out most anchored rules before their regex runs
+        lower = text.lower() if self._anchored_rules else text
+        for index, literals, folded in self._anchored_rules:
+            haystack = lower if folded else text
+            if all(literal in haystack for literal in literals) and patterns[index].search(text):
+                matched.add(index)
+        return matched
+    
+    def scan_text(self, text: str, stop_on_block: bool = False) -> Dict[str, Any]:
         """Scan text for security threats.
         
         Args:
             text: The text to scan
+            stop_on_block: When a BLOCK rule matches, skip the sanitizing
+                work (the text is dropped anyway) and report those rules as
+                'skipped'. Alerts and logging still run for every match.
             
         Returns:
             Dictionary with scan results
@@ -289,8 +571,21 @@ class Sentinel(Entity):
         
         sanitized_text = text
         
+        # Clean text is the common case - settle it without a search per rule
+        matched = self._match_rules(text)
+        if not matched:
+            results['final_length'] = len(text)
+            return results
+        
+        rules = self._enabled_rules[0]
+        
+        # A block decides the outcome, so redacting the text would be wasted
+        skip_sanitize = stop_on_block and any(rules[i].action == RuleAction.BLOCK for i in matched)
+        
+        matched_rules = {rules[i] for i in matched}
         for rule_name, rule in self.rules.items():
-            if rule.matches(text):
+            if rule in matched_rules:
+                rule._match_count += 1
                 results['threats_detected'] += 1
                 self._threats_detected += 1
                 self._last_threat_at = time.time()
@@ -306,9 +601,12 @@ class Sentinel(Entity):
                     logger.warning(f"Blocked message due to rule {rule_name}")
                 
                 elif rule.action == RuleAction.SANITIZE:
-                    sanitized_text = re.sub(rule.pattern, '[REDACTED]', sanitized_text)
-                    action_result['result'] = 'sanitized'
-                    logger.info(f"Sanitized message due to rule {rule_name}")
+                    if skip_sanitize:
+                        action_result['result'] = 'skipped'
+                    else:
+                        sanitized_text = re.sub(rule.pattern, '[REDACTED]', sanitized_text)
+                        action_result['result'] = 'sanitized'
+                        logger.info(f"Sanitized message due to rule {rule_name}")
                 
                 elif rule.action == RuleAction.ALERT:
                     if self.socketio:
@@ -344,14 +642,14 @@ class Sentinel(Entity):
         
         # If data is a string, scan it directly
         if isinstance(data, str):
-            results = self.scan_text(data)
+            results = self.scan_text(data, stop_on_block=True)
             return results['sanitized_text'] if results['allowed'] else None
         
         # If data is a dictionary with a 'message' field, scan that
         elif isinstance(data, dict) and 'message' in data:
             message = data['message']
             if isinstance(message, str):
-                results = self.scan_text(message)
+                results = self.scan_text(message, stop_on_block=True)
                 if results['allowed']:
                     data['message'] = results['sanitized_text']
                     data['sentinel_processed'] = True
@@ -426,8 +724,10 @@ class Sentinel(Entity):
         """
         try:
             rules_data = [rule.to_dict() for rule in self.rules.values()]
+            # Encode in memory and write once; json.dump issues a write per token
+            text = json.dumps(rules_data, indent=2)
             with open(file_path, 'w') as f:
-                json.dump(rules_data, f, indent=2)
+                f.write(text)
             logger.info(f"Exported {len(rules_data)} rules to {file_path}")
             return True
         except Exception as e:
@@ -445,21 +745,26 @@ class Sentinel(Entity):
             Number of rules imported
         """
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'rb') as f:
                 rules_data = json.load(f)
             
+            # Build every rule first so a bad entry leaves the rule set untouched
+            rules = [Rule.from_dict(rule_data) for rule_data in rules_data]
+            
             if replace:
                 self.rules.clear()
                 logger.info("Cleared existing rules")
+            else:
+                replaced = [rule.name for rule in rules if rule.name in self.rules]
+                if replaced:
+                    logger.warning(f"Replacing existing rules: {', '.join(replaced)}")
             
-            imported = 0
-            for rule_data in rules_data:
-                rule = Rule.from_dict(rule_data)
-                self.add_rule(rule)
-                imported += 1
+            # One update and one version bump for the whole batch
+            self.rules.update((rule.name, rule) for rule in rules)
+            self._rules_version += 1
             
-            logger.info(f"Imported {imported} rules from {file_path}")
-            return imported
+            logger.info(f"Imported {len(rules)} rules from {file_path}")
+            return len(rules)
         except Exception as e:
             logger.error(f"Failed to import rules: {e}")
             return 0
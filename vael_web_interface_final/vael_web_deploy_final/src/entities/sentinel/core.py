@@ -19,6 +19,8 @@ import threading
 import json
 import hashlib
 import base64
+from collections import deque
+from itertools import islice
 from enum import Enum, auto
 from typing import Dict, List, Set, Any, Optional, Callable, Tuple, Union
 from datetime import datetime
@@ -66,8 +68,9 @@ class ThreadGuard:
         """Initialize a new ThreadGuard."""
         self._locks: Dict[str, threading.RLock] = {}
         self._owners: Dict[str, str] = {}
-        self._access_log: List[Dict[str, Any]] = []
         self._max_log_size = 1000
+        # Bounded; appending past the limit evicts the oldest entry in O(1)
+        self._access_log: deque = deque(maxlen=self._max_log_size)
         self._global_lock = threading.RLock()
     
     def acquire(self, resource_id: str, entity_id: str, timeout: float = 5.0) -> bool:
@@ -157,11 +160,9 @@ class ThreadGuard:
         if error:
             entry["error"] = error
         
-        self._access_log.append(entry)
-        
-        # Trim log if it gets too large
-        if len(self._access_log) > self._max_log_size:
-            self._access_log = self._access_log[-self._max_log_size:]
+        # Under the lock so detect_deadlocks never sees the deque mutate mid-iteration
+        with self._global_lock:
+            self._access_log.append(entry)
     
     def get_resource_owner(self, resource_id: str) -> Optional[str]:
         """Get the current owner of a resource.
@@ -258,8 +259,9 @@ class MemoryIsolation:
             zone: {} for zone in MemoryZone
         }
         self._permissions: Dict[str, Set[MemoryZone]] = {}
-        self._access_log: List[Dict[str, Any]] = []
         self._max_log_size = 1000
+        # Bounded; appending past the limit evicts the oldest entry in O(1)
+        self._access_log: deque = deque(maxlen=self._max_log_size)
         self._lock = threading.RLock()
     
     def grant_permission(self, entity_id: str, zone: MemoryZone) -> bool:
@@ -415,10 +417,6 @@ class MemoryIsolation:
         
         with self._lock:
             self._access_log.append(entry)
-            
-            # Trim log if it gets too large
-            if len(self._access_log) > self._max_log_size:
-                self._access_log = self._access_log[-self._max_log_size:]
     
     def secure_store(self, entity_id: str, key: str, value: Any, 
                     passphrase: str) -> bool:
@@ -605,10 +603,13 @@ class EmergencyResponse:
         self._socketio = socketio
         self._current_level = SecurityLevel.NORMAL
         self._active_protocols: Dict[EmergencyProtocol, Dict[str, Any]] = {}
-        self._incident_log: List[Dict[str, Any]] = []
         self._max_log_size = 1000
-        self._handlers: Dict[EmergencyProtocol, List[Callable]] = {
-            protocol: [] for protocol in EmergencyProtocol
+        # Bounded; appending past the limit evicts the oldest entry in O(1)
+        self._incident_log: deque = deque(maxlen=self._max_log_size)
+        # Handler tuples are replaced, never mutated, so dispatch can iterate
+        # a snapshot without holding the lock
+        self._handlers: Dict[EmergencyProtocol, Tuple[Callable, ...]] = {
+            protocol: () for protocol in EmergencyProtocol
         }
         self._lock = threading.RLock()
     
@@ -792,10 +793,7 @@ class EmergencyResponse:
             True if handler was registered, False otherwise
         """
         with self._lock:
-            if protocol not in self._handlers:
-                self._handlers[protocol] = []
-            
-            self._handlers[protocol].append(handler)
+            self._handlers[protocol] = self._handlers.get(protocol, ()) + (handler,)
             logger.info(f"Registered handler for protocol {protocol.name}")
             return True
     
@@ -807,10 +805,7 @@ class EmergencyResponse:
             protocol: Protocol being activated
             activation: Activation details
         """
-        if protocol not in self._handlers:
-            return
-        
-        for handler in self._handlers[protocol]:
+        for handler in self._handlers.get(protocol, ()):
             try:
                 handler(activation)
             except Exception as e:
@@ -838,10 +833,6 @@ class EmergencyResponse:
         
         with self._lock:
             self._incident_log.append(incident)
-            
-            # Trim log if it gets too large
-            if len(self._incident_log) > self._max_log_size:
-                self._incident_log = self._incident_log[-self._max_log_size:]
     
     def get_incident_log(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get the security incident log.
@@ -853,11 +844,8 @@ class EmergencyResponse:
             List of incident records
         """
         with self._lock:
-            return sorted(
-                self._incident_log[-limit:],
-                key=lambda x: x["timestamp"],
-                reverse=True
-            )
+            # Appended in time order, so newest first is just reversed
+            return list(islice(reversed(self._incident_log), limit))
     
     def system_lockdown(self, reason: str, 
                        duration: int = 300) -> bool:
@@ -29,6 +29,51 @@ from .. import Entity, registry
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Right hemisphere vocabularies, built once instead of on every analysis
+_POSITIVE_WORDS = frozenset({"good", "great", "excellent", "wonderful", "amazing", "love", "like", "happy", "joy", "positive"})
+_NEGATIVE_WORDS = frozenset({"bad", "terrible", "awful", "horrible", "hate", "dislike", "sad", "angry", "negative", "worst"})
+
+# Theme categories with associated keywords, and every keyword of any theme
+_THEME_KEYWORDS = {
+    "nature": frozenset({"nature", "tree", "forest", "river", "mountain", "ocean", "animal", "plant", "earth", "sky"}),
+    "technology": frozenset({"technology", "computer", "digital", "software", "hardware", "internet", "code", "program", "device", "tech"}),
+    "emotion": frozenset({"emotion", "feel", "feeling", "love", "hate", "joy", "sadness", "anger", "fear", "happiness"}),
+    "society": frozenset({"society", "community", "people", "social", "culture", "politics", "government", "law", "policy", "nation"}),
+    "knowledge": frozenset({"knowledge", "learn", "education", "school", "study", "research", "science", "understand", "wisdom", "information"})
+}
+_THEME_WORDS = frozenset().union(*_THEME_KEYWORDS.values())
+
+# Simple word association dictionary
+_WORD_ASSOCIATIONS = {
+    "water": ["ocean", "river", "lake", "flow", "drink", "blue", "clear"],
+    "fire": ["hot", "burn", "flame", "heat", "red", "orange", "passion"],
+    "earth": ["ground", "soil", "planet", "nature", "green", "life", "solid"],
+    "air": ["wind", "breath", "sky", "invisible", "light", "free", "flow"],
+    "love": ["heart", "emotion", "care", "affection", "relationship", "passion", "warm"],
+    "time": ["clock", "hour", "minute", "second", "past", "future", "present"],
+    "mind": ["brain", "thought", "idea", "intelligence", "consciousness", "thinking", "memory"],
+    "body": ["physical", "health", "strength", "movement", "flesh", "form", "vessel"]
+}
+
+# Key-name hints for concept grouping, lowercase and in precedence order
+_CONCEPT_HINTS = (
+    ("identity", ("name", "title", "label")),
+    ("temporal", ("time", "date", "when")),
+    ("spatial", ("location", "place", "where")),
+    ("quantitative", ("count", "number", "quantity")),
+    ("state", ("status", "state", "condition")),
+)
+
+# Imagery vocabularies for the right hemisphere, scanned with one combined pattern
+_IMAGERY_WORDS = (
+    ("color", ("red", "blue", "green", "yellow", "orange", "purple", "black", "white", "gray", "brown")),
+    ("shape", ("circle", "square", "triangle", "rectangle", "oval", "sphere", "cube", "pyramid", "line", "curve")),
+    ("nature", ("mountain", "river", "ocean", "forest", "tree", "flower", "sky", "cloud", "sun", "moon", "star")),
+)
+_IMAGERY_RE = re.compile(
+    r'\b(?:' + '|'.join(word for _, words in _IMAGERY_WORDS for word in words) + r')\b'
+)
+
 
 class HemisphereType(Enum):
     """Types of hemispheres in the Twin Flame entity."""
@@ -947,13 +992,10 @@ class RightHemisphere(Hemisphere):
         # In a real system, this would use NLP techniques
         
         # Simple keyword-based sentiment analysis
-        positive_words = {"good", "great", "excellent", "wonderful", "amazing", "love", "like", "happy", "joy", "positive"}
-        negative_words = {"bad", "terrible", "awful", "horrible", "hate", "dislike", "sad", "angry", "negative", "worst"}
-        
         words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
         
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        positive_count = sum(1 for word in words if word in _POSITIVE_WORDS)
+        negative_count = sum(1 for word in words if word in _NEGATIVE_WORDS)
         total_words = len(words)
         
         if total_words == 0:
@@ -982,21 +1024,16 @@ class RightHemisphere(Hemisphere):
         # This is a simplified implementation for demonstration
         # In a real system, this would use NLP techniques
         
-        # Theme categories with associated keywords
-        theme_keywords = {
-            "nature": {"nature", "tree", "forest", "river", "mountain", "ocean", "animal", "plant", "earth", "sky"},
-            "technology": {"technology", "computer", "digital", "software", "hardware", "internet", "code", "program", "device", "tech"},
-            "emotion": {"emotion", "feel", "feeling", "love", "hate", "joy", "sadness", "anger", "fear", "happiness"},
-            "society": {"society", "community", "people", "social", "culture", "politics", "government", "law", "policy", "nation"},
-            "knowledge": {"knowledge", "learn", "education", "school", "study", "research", "science", "understand", "wisdom", "information"}
-        }
-        
         words = set(re.findall(r'\b[a-zA-Z]+\b', text.lower()))
         
+        # Most text mentions no theme at all; one set test settles that
+        if _THEME_WORDS.isdisjoint(words):
+            return []
+        
         # Find themes based on keyword matches
         themes = []
-        for theme, keywords in theme_keywords.items():
-            if keywords.intersection(words):
+        for theme, keywords in _THEME_KEYWORDS.items():
+            if not keywords.isdisjoint(words):
                 themes.append(theme)
         
         return themes
@@ -1013,25 +1050,13 @@ class RightHemisphere(Hemisphere):
         # This is a simplified implementation for demonstration
         # In a real system, this would use word embeddings or a knowledge graph
         
-        # Simple word association dictionary
-        associations = {
-            "water": ["ocean", "river", "lake", "flow", "drink", "blue", "clear"],
-            "fire": ["hot", "burn", "flame", "heat", "red", "orange", "passion"],
-            "earth": ["ground", "soil", "planet", "nature", "green", "life", "solid"],
-            "air": ["wind", "breath", "sky", "invisible", "light", "free", "flow"],
-            "love": ["heart", "emotion", "care", "affection", "relationship", "passion", "warm"],
-            "time": ["clock", "hour", "minute", "second", "past", "future", "present"],
-            "mind": ["brain", "thought", "idea", "intelligence", "consciousness", "thinking", "memory"],
-            "body": ["physical", "health", "strength", "movement", "flesh", "form", "vessel"]
-        }
-        
         words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
         result = []
         
         for word in words:
-            if word in associations:
+            if word in _WORD_ASSOCIATIONS:
                 # Add some of the associations
-                result.extend(associations[word][:3])
+                result.extend(_WORD_ASSOCIATIONS[word][:3])
         
         # Remove duplicates and limit result size
         return list(set(result))[:10]
@@ -1048,29 +1073,17 @@ class RightHemisphere(Hemisphere):
         # This is a simplified implementation for demonstration
         # In a real system, this would use more sophisticated NLP
         
-        # Look for color words
-        colors = ["red", "blue", "green", "yellow", "orange", "purple", "black", "white", "gray", "brown"]
-        color_matches = [color for color in colors if re.search(r'\b' + color + r'\b', text.lower())]
+        # One pass over the text finds every vocabulary word present
+        found = set(_IMAGERY_RE.findall(text.lower()))
         
-        # Look for shape words
-        shapes = ["circle", "square", "triangle", "rectangle", "oval", "sphere", "cube", "pyramid", "line", "curve"]
-        shape_matches = [shape for shape in shapes if re.search(r'\b' + shape + r'\b', text.lower())]
-        
-        # Look for nature imagery
-        nature = ["mountain", "river", "ocean", "forest", "tree", "flower", "sky", "cloud", "sun", "moon", "star"]
-        nature_matches = [n for n in nature if re.search(r'\b' + n + r'\b', text.lower())]
-        
-        # Compile imagery
+        # Compile imagery, keeping each vocabulary's order
         imagery = []
         
-        if color_matches:
-            imagery.append({"type": "color", "elements": color_matches})
-        
-        if shape_matches:
-            imagery.append({"type": "shape", "elements": shape_matches})
-        
-        if nature_matches:
-            imagery.append({"type": "nature", "elements": nature_matches})
+        if found:
+            for imagery_type, words in _IMAGERY_WORDS:
+                elements = [word for word in words if word in found]
+                if elements:
+                    imagery.append({"type": imagery_type, "elements": elements})
         
         return imagery
     
@@ -1216,19 +1229,12 @@ class RightHemisphere(Hemisphere):
         # Group by "concept" (simplified)
         concepts = {}
         for k, v in data.items():
-            # Assign a concept based on key name
-            concept = "unknown"
-            
-            if "name" in k.lower() or "title" in k.lower() or "label" in k.lower():
-                concept = "identity"
-            elif "time" in k.lower() or "date" in k.lower() or "when" in k.lower():
-                concept = "temporal"
-            elif "location" in k.lower() or "place" in k.lower() or "where" in k.lower():
-                concept = "spatial"
-            elif "count" in k.lower() or "number" in k.lower() or "quantity" in k.lower():
-                concept = "quantitative"
-            elif "status" in k.lower() or "state" in k.lower() or "condition" in k.lower():
-                concept = "state"
+            # Assign a concept based on key name, lowercased once per key
+            key = k.lower()
+            concept = next(
+                (c for c, hints in _CONCEPT_HINTS if any(hint in key for hint in hints)),
+                "unknown"
+            )
             
             if concept not in concepts:
                 concepts[concept] = {}